@@ -6,12 +6,13 @@ import hashlib
 import os
 from typing import Dict, Any
 
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import Depends, FastAPI, Request, HTTPException
 from fastapi.responses import JSONResponse
 from mangum import Mangum
 from pydantic import ValidationError
 
 # Import our utilities
+from src.handlers.health import get_health_status
 from src.models.responses import success_response, error_response, not_found_response, validation_error_response
 from src.utils.logger import setup_logging
 from src.services.dynamo import TenantDeliveryConfigService, TenantNotFoundError, DynamoDBError
@@ -72,11 +73,16 @@ AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 # Initialize tenant delivery config service
 delivery_config_service = TenantDeliveryConfigService(table_name=TENANT_CONFIG_TABLE, region=AWS_REGION)
 
+
+def get_delivery_config_service() -> TenantDeliveryConfigService:
+    """Dependency providing the delivery config service (override via app.dependency_overrides in tests)"""
+    return delivery_config_service
+
+
 @app.get("/api/v1/health")
 async def health_check():
     """Health check endpoint - no authentication required"""
     try:
-        from src.handlers.health import get_health_status
         return get_health_status()
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
@@ -84,7 +90,8 @@ async def health_check():
 
 
 @app.get("/api/v1/delivery-configs", response_model=Dict[str, Any])
-async def list_all_delivery_configs(limit: int = 50, last_key: str = None):
+async def list_all_delivery_configs(limit: int = 50, last_key: str = None,
+                                    service: TenantDeliveryConfigService = Depends(get_delivery_config_service)):
     """List all delivery configurations with pagination"""
     try:
         logger.info(f"Listing all delivery configs with limit={limit}, last_key={last_key}")
@@ -98,7 +105,7 @@ async def list_all_delivery_configs(limit: int = 50, last_key: str = None):
             except ValueError:
                 raise HTTPException(status_code=400, detail="Invalid last_key format. Expected 'tenant_id#type'")
         
-        result = delivery_config_service.list_tenant_configs(limit=limit, last_key=parsed_last_key)
+        result = service.list_tenant_configs(limit=limit, last_key=parsed_last_key)
         
         return {"data": result, "status": "success"}
         
@@ -111,12 +118,13 @@ async def list_all_delivery_configs(limit: int = 50, last_key: str = None):
 
 
 @app.get("/api/v1/tenants/{tenant_id}/delivery-configs", response_model=Dict[str, Any])
-async def list_tenant_delivery_configs(tenant_id: str):
+async def list_tenant_delivery_configs(tenant_id: str,
+                                       service: TenantDeliveryConfigService = Depends(get_delivery_config_service)):
     """List all delivery configurations for a tenant"""
     try:
         logger.info(f"Listing delivery configs for tenant: {tenant_id}")
         
-        configs = delivery_config_service.get_tenant_configs(tenant_id)
+        configs = service.get_tenant_configs(tenant_id)
         
         return {"data": {"configurations": configs, "count": len(configs)}, "status": "success"}
         
@@ -129,12 +137,13 @@ async def list_tenant_delivery_configs(tenant_id: str):
 
 
 @app.get("/api/v1/tenants/{tenant_id}/delivery-configs/{delivery_type}")
-async def get_tenant_delivery_config(tenant_id: str, delivery_type: str):
+async def get_tenant_delivery_config(tenant_id: str, delivery_type: str,
+                                     service: TenantDeliveryConfigService = Depends(get_delivery_config_service)):
     """Get a specific tenant delivery configuration"""
     try:
         logger.info(f"Getting delivery config: {tenant_id}/{delivery_type}")
         
-        config_data = delivery_config_service.get_tenant_config(tenant_id, delivery_type)
+        config_data = service.get_tenant_config(tenant_id, delivery_type)
         return {"data": config_data, "status": "success"}
         
     except TenantNotFoundError as e:
@@ -149,7 +158,8 @@ async def get_tenant_delivery_config(tenant_id: str, delivery_type: str):
 
 
 @app.post("/api/v1/tenants/{tenant_id}/delivery-configs")
-async def create_tenant_delivery_config(tenant_id: str, config_data: TenantDeliveryConfigCreateRequest):
+async def create_tenant_delivery_config(tenant_id: str, config_data: TenantDeliveryConfigCreateRequest,
+                                        service: TenantDeliveryConfigService = Depends(get_delivery_config_service)):
     """Create a new tenant delivery configuration"""
     try:
         # Ensure tenant_id matches URL parameter
@@ -162,7 +172,7 @@ async def create_tenant_delivery_config(tenant_id: str, config_data: TenantDeliv
         config_dict = config_data.model_dump(exclude_none=True)
         
         # Create delivery config in DynamoDB
-        created_config = delivery_config_service.create_tenant_config(config_dict)
+        created_config = service.create_tenant_config(config_dict)
         
         return JSONResponse(
             status_code=201,
@@ -184,7 +194,8 @@ async def create_tenant_delivery_config(tenant_id: str, config_data: TenantDeliv
 
 
 @app.put("/api/v1/tenants/{tenant_id}/delivery-configs/{delivery_type}")
-async def update_tenant_delivery_config(tenant_id: str, delivery_type: str, config_data: TenantDeliveryConfigUpdateRequest):
+async def update_tenant_delivery_config(tenant_id: str, delivery_type: str, config_data: TenantDeliveryConfigUpdateRequest,
+                                        service: TenantDeliveryConfigService = Depends(get_delivery_config_service)):
     """Update a tenant delivery configuration"""
     try:
         logger.info(f"Updating delivery config: {tenant_id}/{delivery_type}")
@@ -196,7 +207,7 @@ async def update_tenant_delivery_config(tenant_id: str, delivery_type: str, conf
             raise HTTPException(status_code=400, detail="No fields provided for update")
         
         # Update delivery config in DynamoDB
-        updated_config = delivery_config_service.update_tenant_config(tenant_id, delivery_type, update_dict)
+        updated_config = service.update_tenant_config(tenant_id, delivery_type, update_dict)
         
         return {"data": updated_config, "status": "success", "message": "Delivery configuration updated successfully"}
         
@@ -215,7 +226,8 @@ async def update_tenant_delivery_config(tenant_id: str, delivery_type: str, conf
 
 
 @app.patch("/api/v1/tenants/{tenant_id}/delivery-configs/{delivery_type}")
-async def patch_tenant_delivery_config(tenant_id: str, delivery_type: str, config_data: TenantDeliveryConfigPatchRequest):
+async def patch_tenant_delivery_config(tenant_id: str, delivery_type: str, config_data: TenantDeliveryConfigPatchRequest,
+                                       service: TenantDeliveryConfigService = Depends(get_delivery_config_service)):
     """Partially update a tenant delivery configuration (e.g., enable/disable)"""
     try:
         logger.info(f"Patching delivery config: {tenant_id}/{delivery_type}")
@@ -227,7 +239,7 @@ async def patch_tenant_delivery_config(tenant_id: str, delivery_type: str, confi
             raise HTTPException(status_code=400, detail="No fields provided for patch")
         
         # Patch delivery config in DynamoDB
-        patched_config = delivery_config_service.patch_tenant_config(tenant_id, delivery_type, patch_dict)
+        patched_config = service.patch_tenant_config(tenant_id, delivery_type, patch_dict)
         
         return {"data": patched_config, "status": "success", "message": "Delivery configuration patched successfully"}
         
@@ -246,13 +258,14 @@ async def patch_tenant_delivery_config(tenant_id: str, delivery_type: str, confi
 
 
 @app.delete("/api/v1/tenants/{tenant_id}/delivery-configs/{delivery_type}")
-async def delete_tenant_delivery_config(tenant_id: str, delivery_type: str):
+async def delete_tenant_delivery_config(tenant_id: str, delivery_type: str,
+                                        service: TenantDeliveryConfigService = Depends(get_delivery_config_service)):
     """Delete a tenant delivery configuration"""
     try:
         logger.info(f"Deleting delivery config: {tenant_id}/{delivery_type}")
         
         # Delete delivery config from DynamoDB
-        delivery_config_service.delete_tenant_config(tenant_id, delivery_type)
+        service.delete_tenant_config(tenant_id, delivery_type)
         
         return {"status": "success", "message": f"Delivery configuration '{tenant_id}/{delivery_type}' deleted successfully"}
         
@@ -268,13 +281,14 @@ async def delete_tenant_delivery_config(tenant_id: str, delivery_type: str):
 
 
 @app.get("/api/v1/tenants/{tenant_id}/delivery-configs/{delivery_type}/validate")
-async def validate_tenant_delivery_config(tenant_id: str, delivery_type: str):
+async def validate_tenant_delivery_config(tenant_id: str, delivery_type: str,
+                                          service: TenantDeliveryConfigService = Depends(get_delivery_config_service)):
     """Validate a tenant delivery configuration"""
     try:
         logger.info(f"Validating delivery config: {tenant_id}/{delivery_type}")
         
         # Validate delivery configuration
-        validation_result = delivery_config_service.validate_tenant_config(tenant_id, delivery_type)
+        validation_result = service.validate_tenant_config(tenant_id, delivery_type)
         
         return {"data": validation_result, "status": "success"}
         
@@ -13,11 +13,11 @@ import (
 
 	"github.com/aws/aws-lambda-go/lambda"
 	"github.com/aws/aws-sdk-go-v2/config"
-	"github.com/aws/aws-sdk-go-v2/service/cloudwatch"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb"
 	"github.com/aws/aws-sdk-go-v2/service/s3"
 	"github.com/aws/aws-sdk-go-v2/service/sqs"
 	"github.com/aws/aws-sdk-go-v2/service/sts"
+	awsmetrics "github.com/openshift/rosa-log-router/internal/aws"
 	"github.com/openshift/rosa-log-router/internal/models"
 	"github.com/openshift/rosa-log-router/internal/processor"
 )
@@ -74,7 +74,7 @@ func main() {
 	dynamoClient := dynamodb.NewFromConfig(awsCfg)
 	sqsClient := sqs.NewFromConfig(awsCfg)
 	stsClient := sts.NewFromConfig(awsCfg)
-	cwClient := cloudwatch.NewFromConfig(awsCfg)
+	cwClient := awsmetrics.NewCloudWatchMetricsClient(awsCfg)
 
 	// Create processor
 	// Pass endpoint URL (if configured) to deliverers for LocalStack support
@@ -160,6 +160,13 @@ func loadConfig() (*models.Config, error) {
 		}
 		cfg.ScanInterval = i
 	}
+	if v := os.Getenv("TENANT_CONFIG_CACHE_TTL"); v != "" {
+		i, err := strconv.Atoi(v)
+		if err != nil {
+			return nil, fmt.Errorf("failed to convert value of 'TENANT_CONFIG_CACHE_TTL' to integer: %w", err)
+		}
+		cfg.TenantConfigCacheTTL = i
+	}
 	if v := os.Getenv("AWS_S3_USE_PATH_STYLE"); v != "" {
 		cfg.S3UsePathStyle = v == "true" || v == "1"
 	}
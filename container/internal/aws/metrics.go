@@ -3,10 +3,17 @@ package aws
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"log/slog"
+	"net"
+	"net/http"
+	"sync"
+	"time"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
+	"github.com/aws/aws-sdk-go-v2/aws/retry"
+	awshttp "github.com/aws/aws-sdk-go-v2/aws/transport/http"
 	"github.com/aws/aws-sdk-go-v2/service/cloudwatch"
 	"github.com/aws/aws-sdk-go-v2/service/cloudwatch/types"
 )
@@ -24,16 +31,54 @@ const (
 
 	MethodCloudwatch = "cloudwatch"
 	MethodS3         = "s3"
+
+	// MaxMetricDataPerRequest is the PutMetricData limit on metric datums per request
+	MaxMetricDataPerRequest = 1000
+
+	// MaxValuesPerMetricDatum is the PutMetricData limit on distinct values in one datum's Values array
+	MaxValuesPerMetricDatum = 150
+
+	// Connection and retry settings for the metrics CloudWatch client
+	metricsMaxIdleConnsPerHost = 50
+	metricsMaxAttempts         = 5
+	metricsDialTimeout         = 3 * time.Second
 )
 
+// CloudWatchMetricsAPI defines the interface for CloudWatch metric operations
+type CloudWatchMetricsAPI interface {
+	PutMetricData(ctx context.Context, params *cloudwatch.PutMetricDataInput, optFns ...func(*cloudwatch.Options)) (*cloudwatch.PutMetricDataOutput, error)
+}
+
+// NewCloudWatchMetricsClient creates the CloudWatch client used for publishing metrics. It keeps more
+// idle connections than the SDK default so concurrent PutMetricData requests reuse TLS connections,
+// and uses adaptive retries so throttling slows the client down instead of failing requests.
+func NewCloudWatchMetricsClient(cfg aws.Config) *cloudwatch.Client {
+	httpClient := awshttp.NewBuildableClient().
+		WithDialerOptions(func(d *net.Dialer) {
+			d.Timeout = metricsDialTimeout
+		}).
+		WithTransportOptions(func(tr *http.Transport) {
+			tr.MaxIdleConnsPerHost = metricsMaxIdleConnsPerHost
+		})
+
+	return cloudwatch.NewFromConfig(cfg, func(o *cloudwatch.Options) {
+		o.HTTPClient = httpClient
+		o.Retryer = retry.NewAdaptiveMode(func(ao *retry.AdaptiveModeOptions) {
+			ao.StandardOptions = append(ao.StandardOptions, func(so *retry.StandardOptions) {
+				so.MaxAttempts = metricsMaxAttempts
+			})
+		})
+	})
+}
+
 // MetricsPublisher handles publishing metrics to CloudWatch
 type MetricsPublisher struct {
-	client *cloudwatch.Client
+	client CloudWatchMetricsAPI
 	logger *slog.Logger
 }
 
 // NewMetricsPublisher creates a new metrics publisher
-func NewMetricsPublisher(client *cloudwatch.Client, logger *slog.Logger) *MetricsPublisher {
+func NewMetricsPublisher(client CloudWatchMetricsAPI, logger *slog.Logger) *MetricsPublisher {
 	return &MetricsPublisher{
 		client: client,
 		logger: logger,
@@ -49,30 +94,160 @@ func (p *MetricsPublisher) PushMetrics(ctx context.Context, tenantID, method str
 		return nil
 	}
 
+	if batch := metricsBatchFromContext(ctx); batch != nil {
+		batch.add(tenantID, method, metricsData)
+		return nil
+	}
+
+	dimensions := tenantDimensions(tenantID)
 	metricData := make([]types.MetricDatum, 0, len(metricsData))
 
+	// Datums point into two slices sized up front, so the name and value
+	// pointers need no separate allocation per metric; only the prefixed
+	// name string is still built for each one
+	names := make([]string, 0, len(metricsData))
+	values := make([]float64, 0, len(metricsData))
+	prefix := metricNamePrefix(method)
+
 	for metricDimension, value := range metricsData {
-		metricName := fmt.Sprintf("LogCount/%s/%s", method, metricDimension)
+		names = append(names, prefix+metricDimension)
+		values = append(values, value)
 
+		i := len(names) - 1
 		metricData = append(metricData, types.MetricDatum{
-			MetricName: aws.String(metricName),
-			Dimensions: []types.Dimension{
-				{
-					Name:  aws.String("Tenant"),
-					Value: aws.String(tenantID),
-				},
-			},
-			Value: aws.Float64(value),
-			Unit:  types.StandardUnitCount,
+			MetricName: &names[i],
+			Dimensions: dimensions,
+			Value:      &values[i],
+			Unit:       types.StandardUnitCount,
 		})
 	}
 
-	_, err := p.client.PutMetricData(ctx, &cloudwatch.PutMetricDataInput{
-		Namespace:  aws.String(MetricsNamespace),
-		MetricData: metricData,
-	})
+	return p.putMetricData(ctx, tenantID, method, metricData)
+}
+
+// PushMetricValues publishes repeated observations of the same metrics to CloudWatch
+// metricsData maps metric names to every observed value (e.g., {"delivery_latency": {120, 95, 120}})
+// Identical values are folded into the Values/Counts arrays of a single datum so CloudWatch
+// computes the statistics server-side instead of receiving one datum per observation
+func (p *MetricsPublisher) PushMetricValues(ctx context.Context, tenantID, method string, metricsData map[string][]float64) error {
+	dimensions := tenantDimensions(tenantID)
+	metricData := make([]types.MetricDatum, 0, len(metricsData))
+	prefix := metricNamePrefix(method)
+
+	for metricDimension, observations := range metricsData {
+		metricName := prefix + metricDimension
+
+		values, counts := aggregateValues(observations)
+		for start := 0; start < len(values); start += MaxValuesPerMetricDatum {
+			end := min(start+MaxValuesPerMetricDatum, len(values))
+
+			metricData = append(metricData, types.MetricDatum{
+				MetricName: aws.String(metricName),
+				Dimensions: dimensions,
+				Values:     values[start:end],
+				Counts:     counts[start:end],
+				Unit:       types.StandardUnitCount,
+			})
+		}
+	}
+
+	if len(metricData) == 0 {
+		p.logger.Debug("no metrics to push")
+		return nil
+	}
+
+	return p.putMetricData(ctx, tenantID, method, metricData)
+}
+
+// MetricsBatch collects the metrics pushed while processing a batch of records so they can be
+// published together, with one PushMetricValues call per tenant and delivery method
+type MetricsBatch struct {
+	mu           sync.Mutex
+	observations map[metricsBatchKey]map[string][]float64
+}
+
+type metricsBatchKey struct {
+	tenantID string
+	method   string
+}
+
+type metricsBatchContextKey struct{}
 
-	if err != nil {
+// NewMetricsBatch creates an empty metrics batch
+func NewMetricsBatch() *MetricsBatch {
+	return &MetricsBatch{
+		observations: make(map[metricsBatchKey]map[string][]float64),
+	}
+}
+
+// WithMetricsBatch returns a context in which PushMetrics records into batch instead of
+// calling CloudWatch; the batch is published with FlushMetricsBatch
+func WithMetricsBatch(ctx context.Context, batch *MetricsBatch) context.Context {
+	return context.WithValue(ctx, metricsBatchContextKey{}, batch)
+}
+
+func metricsBatchFromContext(ctx context.Context) *MetricsBatch {
+	batch, _ := ctx.Value(metricsBatchContextKey{}).(*MetricsBatch)
+	return batch
+}
+
+func (b *MetricsBatch) add(tenantID, method string, metricsData map[string]float64) {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+
+	key := metricsBatchKey{tenantID: tenantID, method: method}
+	metrics, ok := b.observations[key]
+	if !ok {
+		metrics = make(map[string][]float64, len(metricsData))
+		b.observations[key] = metrics
+	}
+	for metricDimension, value := range metricsData {
+		metrics[metricDimension] = append(metrics[metricDimension], value)
+	}
+}
+
+// FlushMetricsBatch publishes and clears everything recorded in batch. Each observation is kept
+// as its own sample via Values/Counts, so CloudWatch statistics match per-record publishing.
+func (p *MetricsPublisher) FlushMetricsBatch(ctx context.Context, batch *MetricsBatch) error {
+	batch.mu.Lock()
+	observations := batch.observations
+	batch.observations = make(map[metricsBatchKey]map[string][]float64)
+	batch.mu.Unlock()
+
+	var errs []error
+	for key, metricsData := range observations {
+		if err := p.PushMetricValues(ctx, key.tenantID, key.method, metricsData); err != nil {
+			errs = append(errs, err)
+		}
+	}
+
+	return errors.Join(errs...)
+}
+
+// putMetricData sends metric data in as few PutMetricData requests as the per-request datum
+// limit allows; requests are sent concurrently, so a tenant with many metrics waits for one
+// round trip rather than one per request
+func (p *MetricsPublisher) putMetricData(ctx context.Context, tenantID, method string, metricData []types.MetricDatum) error {
+	batchCount := (len(metricData) + MaxMetricDataPerRequest - 1) / MaxMetricDataPerRequest
+	errs := make([]error, batchCount)
+
+	var wg sync.WaitGroup
+	for i := 0; i < batchCount; i++ {
+		start := i * MaxMetricDataPerRequest
+		end := min(start+MaxMetricDataPerRequest, len(metricData))
+
+		wg.Add(1)
+		go func(i int, batch []types.MetricDatum) {
+			defer wg.Done()
+			_, errs[i] = p.client.PutMetricData(ctx, &cloudwatch.PutMetricDataInput{
+				Namespace:  aws.String(MetricsNamespace),
+				MetricData: batch,
+			})
+		}(i, metricData[start:end])
+	}
+	wg.Wait()
+
+	if err := errors.Join(errs...); err != nil {
 		p.logger.Error("failed to publish metric to CloudWatch",
 			"tenant_id", tenantID,
 			"method", method,
@@ -88,6 +263,43 @@ func (p *MetricsPublisher) PushMetrics(ctx context.Context, tenantID, method str
 	return nil
 }
 
+// metricNamePrefix returns the "LogCount/<method>/" prefix shared by every metric name of a delivery
+// method; it is built once per call and joined to each metric dimension by plain concatenation
+func metricNamePrefix(method string) string {
+	return "LogCount/" + method + "/"
+}
+
+// tenantDimensions returns the dimensions shared by every datum published for a tenant.
+// The SDK only reads them, so one slice is shared across all datums of a request.
+func tenantDimensions(tenantID string) []types.Dimension {
+	return []types.Dimension{
+		{
+			Name:  aws.String("Tenant"),
+			Value: aws.String(tenantID),
+		},
+	}
+}
+
+// aggregateValues collapses observations into distinct values and how often each occurred,
+// preserving the order in which values were first seen
+func aggregateValues(observations []float64) ([]float64, []float64) {
+	values := make([]float64, 0, len(observations))
+	counts := make([]float64, 0, len(observations))
+	index := make(map[float64]int, len(observations))
+
+	for _, observation := range observations {
+		if i, ok := index[observation]; ok {
+			counts[i]++
+			continue
+		}
+		index[observation] = len(values)
+		values = append(values, observation)
+		counts = append(counts, 1)
+	}
+
+	return values, counts
+}
+
 // PushCloudWatchDeliveryMetrics is a convenience method for CloudWatch delivery metrics
 func (p *MetricsPublisher) PushCloudWatchDeliveryMetrics(ctx context.Context, tenantID string, successfulEvents, failedEvents int) {
 	metrics := map[string]float64{
@@ -1,14 +1,38 @@
 package aws
 
 import (
+	"context"
+	"errors"
+	"fmt"
+	"sync"
 	"testing"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
+	awshttp "github.com/aws/aws-sdk-go-v2/aws/transport/http"
 	"github.com/aws/aws-sdk-go-v2/service/cloudwatch"
+	"github.com/aws/aws-sdk-go-v2/service/cloudwatch/types"
 	"github.com/openshift/rosa-log-router/internal/models"
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 )
 
+// Mock CloudWatch client that records every PutMetricData request (safe for concurrent batches)
+type mockCloudWatchMetricsClient struct {
+	mu               sync.Mutex
+	inputs           []*cloudwatch.PutMetricDataInput
+	putMetricDataErr error
+}
+
+func (m *mockCloudWatchMetricsClient) PutMetricData(ctx context.Context, params *cloudwatch.PutMetricDataInput, optFns ...func(*cloudwatch.Options)) (*cloudwatch.PutMetricDataOutput, error) {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+	m.inputs = append(m.inputs, params)
+	if m.putMetricDataErr != nil {
+		return nil, m.putMetricDataErr
+	}
+	return &cloudwatch.PutMetricDataOutput{}, nil
+}
+
 // Helper to create a CloudWatch client for testing (won't actually call AWS)
 func createTestCloudWatchClient() *cloudwatch.Client {
 	cfg := aws.Config{
@@ -29,6 +53,214 @@ func TestNewMetricsPublisher(t *testing.T) {
 	assert.Equal(t, logger, publisher.logger)
 }
 
+func TestNewCloudWatchMetricsClient(t *testing.T) {
+	client := NewCloudWatchMetricsClient(aws.Config{
+		Region:      "us-east-1",
+		Credentials: aws.AnonymousCredentials{},
+	})
+
+	options := client.Options()
+
+	httpClient, ok := options.HTTPClient.(*awshttp.BuildableClient)
+	require.True(t, ok, "expected a buildable HTTP client, got %T", options.HTTPClient)
+	assert.Equal(t, metricsMaxIdleConnsPerHost, httpClient.GetTransport().MaxIdleConnsPerHost)
+	assert.Equal(t, metricsMaxAttempts, options.Retryer.MaxAttempts())
+}
+
+func TestPushMetrics_BatchesMetricData(t *testing.T) {
+	testCases := []struct {
+		name          string
+		metricCount   int
+		expectedCalls int
+	}{
+		{name: "empty", metricCount: 0, expectedCalls: 0},
+		{name: "single", metricCount: 1, expectedCalls: 1},
+		{name: "exactly_one_batch", metricCount: MaxMetricDataPerRequest, expectedCalls: 1},
+		{name: "one_over_batch", metricCount: MaxMetricDataPerRequest + 1, expectedCalls: 2},
+		{name: "multiple_batches", metricCount: 2500, expectedCalls: 3},
+	}
+
+	for _, tc := range testCases {
+		t.Run(tc.name, func(t *testing.T) {
+			mockClient := &mockCloudWatchMetricsClient{}
+			publisher := NewMetricsPublisher(mockClient, models.NewDefaultLogger())
+
+			metricsData := make(map[string]float64, tc.metricCount)
+			for i := 0; i < tc.metricCount; i++ {
+				metricsData[fmt.Sprintf("metric_%d", i)] = float64(i)
+			}
+
+			err := publisher.PushMetrics(context.Background(), "test-tenant", MethodCloudwatch, metricsData)
+			require.NoError(t, err)
+
+			assert.Len(t, mockClient.inputs, tc.expectedCalls)
+			total := 0
+			for _, input := range mockClient.inputs {
+				assert.Equal(t, MetricsNamespace, aws.ToString(input.Namespace))
+				assert.LessOrEqual(t, len(input.MetricData), MaxMetricDataPerRequest)
+				total += len(input.MetricData)
+			}
+			assert.Equal(t, tc.metricCount, total)
+		})
+	}
+}
+
+func TestPushMetrics_ReportsBatchError(t *testing.T) {
+	mockClient := &mockCloudWatchMetricsClient{putMetricDataErr: errors.New("throttled")}
+	publisher := NewMetricsPublisher(mockClient, models.NewDefaultLogger())
+
+	metricsData := make(map[string]float64, MaxMetricDataPerRequest*2)
+	for i := 0; i < MaxMetricDataPerRequest*2; i++ {
+		metricsData[fmt.Sprintf("metric_%d", i)] = 1
+	}
+
+	err := publisher.PushMetrics(context.Background(), "test-tenant", MethodS3, metricsData)
+
+	require.Error(t, err)
+	assert.Contains(t, err.Error(), "throttled")
+	// Batches are sent concurrently, so every batch is attempted
+	assert.Len(t, mockClient.inputs, 2)
+}
+
+func TestPushMetrics_MetricDatumStructure(t *testing.T) {
+	mockClient := &mockCloudWatchMetricsClient{}
+	publisher := NewMetricsPublisher(mockClient, models.NewDefaultLogger())
+
+	metricsData := map[string]float64{
+		"successful_events": 150,
+		"failed_events":     5,
+		"processing_time":   2.5,
+	}
+
+	err := publisher.PushMetrics(context.Background(), "test-tenant", MethodCloudwatch, metricsData)
+	require.NoError(t, err)
+	require.Len(t, mockClient.inputs, 1)
+
+	metricData := mockClient.inputs[0].MetricData
+	require.Len(t, metricData, len(metricsData))
+
+	for _, datum := range metricData {
+		name := aws.ToString(datum.MetricName)
+		dimension := name[len("LogCount/cloudwatch/"):]
+		assert.Contains(t, metricsData, dimension)
+		assert.Equal(t, metricsData[dimension], aws.ToFloat64(datum.Value))
+		assert.Equal(t, types.StandardUnitCount, datum.Unit)
+
+		require.Len(t, datum.Dimensions, 1)
+		assert.Equal(t, "Tenant", aws.ToString(datum.Dimensions[0].Name))
+		assert.Equal(t, "test-tenant", aws.ToString(datum.Dimensions[0].Value))
+	}
+}
+
+func TestPushMetrics_LargeMetricMapValues(t *testing.T) {
+	mockClient := &mockCloudWatchMetricsClient{}
+	publisher := NewMetricsPublisher(mockClient, models.NewDefaultLogger())
+
+	metricsData := make(map[string]float64, 5000)
+	for i := 0; i < 5000; i++ {
+		metricsData[fmt.Sprintf("metric_%d", i)] = float64(i) + 0.5
+	}
+
+	err := publisher.PushMetrics(context.Background(), "test-tenant", MethodS3, metricsData)
+	require.NoError(t, err)
+
+	seen := make(map[string]float64, len(metricsData))
+	for _, input := range mockClient.inputs {
+		for _, datum := range input.MetricData {
+			seen[aws.ToString(datum.MetricName)] = aws.ToFloat64(datum.Value)
+		}
+	}
+
+	require.Len(t, seen, len(metricsData))
+	for name, value := range metricsData {
+		assert.Equal(t, value, seen["LogCount/s3/"+name], name)
+	}
+}
+
+func TestPushMetricValues_AggregatesRepeatedValues(t *testing.T) {
+	mockClient := &mockCloudWatchMetricsClient{}
+	publisher := NewMetricsPublisher(mockClient, models.NewDefaultLogger())
+
+	metricsData := map[string][]float64{
+		"delivery_latency": {120, 95, 120, 120, 95, 300},
+	}
+
+	err := publisher.PushMetricValues(context.Background(), "test-tenant", MethodS3, metricsData)
+	require.NoError(t, err)
+	require.Len(t, mockClient.inputs, 1)
+	require.Len(t, mockClient.inputs[0].MetricData, 1)
+
+	datum := mockClient.inputs[0].MetricData[0]
+	assert.Equal(t, "LogCount/s3/delivery_latency", aws.ToString(datum.MetricName))
+	assert.Nil(t, datum.Value)
+	assert.Equal(t, []float64{120, 95, 300}, datum.Values)
+	assert.Equal(t, []float64{3, 2, 1}, datum.Counts)
+	assert.Equal(t, "test-tenant", aws.ToString(datum.Dimensions[0].Value))
+}
+
+func TestPushMetricValues_SplitsDistinctValuesAcrossDatums(t *testing.T) {
+	mockClient := &mockCloudWatchMetricsClient{}
+	publisher := NewMetricsPublisher(mockClient, models.NewDefaultLogger())
+
+	observations := make([]float64, MaxValuesPerMetricDatum+10)
+	for i := range observations {
+		observations[i] = float64(i)
+	}
+
+	err := publisher.PushMetricValues(context.Background(), "test-tenant", MethodCloudwatch, map[string][]float64{
+		"delivery_latency": observations,
+	})
+	require.NoError(t, err)
+	require.Len(t, mockClient.inputs, 1)
+
+	metricData := mockClient.inputs[0].MetricData
+	require.Len(t, metricData, 2)
+	assert.Len(t, metricData[0].Values, MaxValuesPerMetricDatum)
+	assert.Len(t, metricData[1].Values, 10)
+}
+
+func TestPushMetricValues_Empty(t *testing.T) {
+	mockClient := &mockCloudWatchMetricsClient{}
+	publisher := NewMetricsPublisher(mockClient, models.NewDefaultLogger())
+
+	err := publisher.PushMetricValues(context.Background(), "test-tenant", MethodS3, map[string][]float64{"delivery_latency": {}})
+
+	require.NoError(t, err)
+	assert.Empty(t, mockClient.inputs)
+}
+
+func TestFlushMetricsBatch_OneRequestPerTenant(t *testing.T) {
+	mockClient := &mockCloudWatchMetricsClient{}
+	publisher := NewMetricsPublisher(mockClient, models.NewDefaultLogger())
+
+	batch := NewMetricsBatch()
+	ctx := WithMetricsBatch(context.Background(), batch)
+
+	tenants := []string{"tenant-a", "tenant-b", "tenant-c"}
+	for i := 0; i < 100; i++ {
+		publisher.PushS3DeliveryMetrics(ctx, tenants[i%len(tenants)], true)
+	}
+	assert.Empty(t, mockClient.inputs, "metrics should be held until the batch is flushed")
+
+	err := publisher.FlushMetricsBatch(context.Background(), batch)
+	require.NoError(t, err)
+	require.Len(t, mockClient.inputs, len(tenants))
+
+	var total float64
+	for _, input := range mockClient.inputs {
+		require.Len(t, input.MetricData, 1)
+		datum := input.MetricData[0]
+		assert.Equal(t, "LogCount/s3/successful_delivery", *datum.MetricName)
+		assert.Equal(t, []float64{1}, datum.Values)
+		total += datum.Counts[0]
+	}
+	assert.Equal(t, float64(100), total)
+
+	// A flushed batch is empty
+	require.NoError(t, publisher.FlushMetricsBatch(context.Background(), batch))
+	assert.Len(t, mockClient.inputs, len(tenants))
+}
+
 func TestMetricsNamespace(t *testing.T) {
 	// Verify the namespace constant
 	assert.Equal(t, "HCPLF/LogForwarding", MetricsNamespace)
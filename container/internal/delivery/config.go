@@ -2,37 +2,70 @@ package delivery
 
 import (
 	"context"
+	"sync"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
 	"github.com/aws/aws-sdk-go-v2/config"
 )
 
+var (
+	baseConfigMu     sync.Mutex
+	baseConfig       aws.Config
+	baseConfigLoaded bool
+
+	// loadDefaultConfig is swapped out in tests to simulate load failures
+	loadDefaultConfig = config.LoadDefaultConfig
+)
+
+// loadBaseConfig loads the default AWS config once per process. Configs for assumed roles are
+// copied from it, so deliveries don't re-resolve the environment and shared config files on every
+// call. Only a successful load is cached: after a failure (e.g. a transient error at cold start)
+// the next call retries.
+func loadBaseConfig(ctx context.Context) (aws.Config, error) {
+	baseConfigMu.Lock()
+	defer baseConfigMu.Unlock()
+
+	if baseConfigLoaded {
+		return baseConfig, nil
+	}
+
+	cfg, err := loadDefaultConfig(ctx)
+	if err != nil {
+		return aws.Config{}, err
+	}
+	baseConfig = cfg
+	baseConfigLoaded = true
+	return baseConfig, nil
+}
+
 // buildConfigWithEndpoint creates an AWS config with the specified region, credentials, and optional endpoint URL.
 // This is used when assuming roles to create clients that need to work with LocalStack (via endpoint URL override)
 // or real AWS (with empty endpoint URL).
 func buildConfigWithEndpoint(ctx context.Context, region string, creds aws.Credentials, endpointURL string) (aws.Config, error) {
-	configOptions := []func(*config.LoadOptions) error{
-		config.WithRegion(region),
-		config.WithCredentialsProvider(aws.CredentialsProviderFunc(func(ctx context.Context) (aws.Credentials, error) {
-			return creds, nil
-		})),
+	base, err := loadBaseConfig(ctx)
+	if err != nil {
+		return aws.Config{}, err
 	}
 
+	cfg := base.Copy()
+	cfg.Region = region
+	cfg.Credentials = aws.CredentialsProviderFunc(func(ctx context.Context) (aws.Credentials, error) {
+		return creds, nil
+	})
+
 	// Add endpoint resolver if endpoint URL is configured (for LocalStack)
 	// Note: Using deprecated endpoint resolver API for backward compatibility with LocalStack.
 	// The modern per-service endpoint configuration would require refactoring the service client creation.
 	// This approach works consistently across all AWS services (S3, CloudWatch, STS, etc.).
 	// SA1019 deprecation warnings are suppressed in .golangci.yml for LocalStack compatibility.
 	if endpointURL != "" {
-		configOptions = append(configOptions, config.WithEndpointResolverWithOptions(
-			aws.EndpointResolverWithOptionsFunc(func(service, region string, options ...interface{}) (aws.Endpoint, error) {
-				return aws.Endpoint{
-					URL:               endpointURL,
-					HostnameImmutable: true,
-				}, nil
-			}),
-		))
+		cfg.EndpointResolverWithOptions = aws.EndpointResolverWithOptionsFunc(func(service, region string, options ...interface{}) (aws.Endpoint, error) {
+			return aws.Endpoint{
+				URL:               endpointURL,
+				HostnameImmutable: true,
+			}, nil
+		})
 	}
 
-	return config.LoadDefaultConfig(ctx, configOptions...)
+	return cfg, nil
 }
@@ -0,0 +1,102 @@
+package delivery
+
+import (
+	"context"
+	"errors"
+	"testing"
+
+	"github.com/aws/aws-sdk-go-v2/aws"
+	"github.com/aws/aws-sdk-go-v2/config"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestBuildConfigWithEndpoint(t *testing.T) {
+	ctx := context.Background()
+	creds := aws.Credentials{
+		AccessKeyID:     "AKIATEST",
+		SecretAccessKey: "secret",
+		SessionToken:    "token",
+	}
+
+	cfg, err := buildConfigWithEndpoint(ctx, "eu-west-1", creds, "")
+	require.NoError(t, err)
+
+	assert.Equal(t, "eu-west-1", cfg.Region)
+	assert.Nil(t, cfg.EndpointResolverWithOptions)
+
+	resolved, err := cfg.Credentials.Retrieve(ctx)
+	require.NoError(t, err)
+	assert.Equal(t, creds, resolved)
+}
+
+func TestBuildConfigWithEndpoint_EndpointOverride(t *testing.T) {
+	cfg, err := buildConfigWithEndpoint(context.Background(), "us-east-1", aws.Credentials{}, "http://localhost:4566")
+	require.NoError(t, err)
+	require.NotNil(t, cfg.EndpointResolverWithOptions)
+
+	endpoint, err := cfg.EndpointResolverWithOptions.ResolveEndpoint("s3", "us-east-1")
+	require.NoError(t, err)
+	assert.Equal(t, "http://localhost:4566", endpoint.URL)
+	assert.True(t, endpoint.HostnameImmutable)
+}
+
+// stubLoadDefaultConfig empties the base config cache and replaces LoadDefaultConfig with load
+// for the rest of the test, restoring both afterwards
+func stubLoadDefaultConfig(t *testing.T, load func(ctx context.Context, optFns ...func(*config.LoadOptions) error) (aws.Config, error)) {
+	t.Helper()
+
+	baseConfigMu.Lock()
+	savedConfig, savedLoaded, savedLoader := baseConfig, baseConfigLoaded, loadDefaultConfig
+	baseConfig, baseConfigLoaded, loadDefaultConfig = aws.Config{}, false, load
+	baseConfigMu.Unlock()
+
+	t.Cleanup(func() {
+		baseConfigMu.Lock()
+		baseConfig, baseConfigLoaded, loadDefaultConfig = savedConfig, savedLoaded, savedLoader
+		baseConfigMu.Unlock()
+	})
+}
+
+func TestBuildConfigWithEndpoint_LoadsDefaultConfigOnce(t *testing.T) {
+	calls := 0
+	stubLoadDefaultConfig(t, func(ctx context.Context, optFns ...func(*config.LoadOptions) error) (aws.Config, error) {
+		calls++
+		return aws.Config{Region: "us-east-1"}, nil
+	})
+
+	ctx := context.Background()
+	first, err := buildConfigWithEndpoint(ctx, "us-east-1", aws.Credentials{AccessKeyID: "first"}, "")
+	require.NoError(t, err)
+	second, err := buildConfigWithEndpoint(ctx, "us-west-2", aws.Credentials{AccessKeyID: "second"}, "")
+	require.NoError(t, err)
+
+	// Configs differ per role/region but come from a single default config load
+	assert.Equal(t, 1, calls)
+	assert.NotEqual(t, first.Region, second.Region)
+}
+
+func TestLoadBaseConfig_RetriesAfterFailedLoad(t *testing.T) {
+	calls := 0
+	stubLoadDefaultConfig(t, func(ctx context.Context, optFns ...func(*config.LoadOptions) error) (aws.Config, error) {
+		calls++
+		if calls == 1 {
+			return aws.Config{}, errors.New("transient failure")
+		}
+		return aws.Config{Region: "us-east-1"}, nil
+	})
+
+	ctx := context.Background()
+
+	_, err := loadBaseConfig(ctx)
+	require.Error(t, err, "first load fails")
+
+	cfg, err := loadBaseConfig(ctx)
+	require.NoError(t, err, "a failed load must not be cached")
+	assert.Equal(t, "us-east-1", cfg.Region)
+
+	cfg, err = loadBaseConfig(ctx)
+	require.NoError(t, err)
+	assert.Equal(t, "us-east-1", cfg.Region)
+	assert.Equal(t, 2, calls, "a successful load is cached")
+}
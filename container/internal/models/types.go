@@ -1,6 +1,7 @@
 package models
 
 import (
+	"encoding/json"
 	"log/slog"
 	"os"
 	"slices"
@@ -94,6 +95,8 @@ type S3Event struct {
 // SNSMessage represents an SNS message containing S3 event
 type SNSMessage struct {
 	Message string `json:"Message"`
+	// ProcessingMetadata is left undecoded so the SQS body is scanned once; it is only present on re-queued messages
+	ProcessingMetadata json.RawMessage `json:"processing_metadata,omitempty"`
 }
 
 // VectorMetadataFields are Vector metadata fields that should be excluded when creating fallback messages.
@@ -120,6 +123,7 @@ type Config struct {
 	ScanInterval                  int    // For scan mode
 	S3UsePathStyle                bool   // Use path-style S3 URLs (for LocalStack; defaults to false for AWS virtual-hosted style)
 	AWSEndpointURL                string // AWS endpoint URL (for LocalStack/testing; empty for real AWS)
+	TenantConfigCacheTTL          int    // Seconds to cache tenant delivery configs per process (0 disables caching)
 }
 
 // DefaultConfig returns a configuration with default values
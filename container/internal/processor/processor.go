@@ -46,7 +46,7 @@ func NewProcessor(
 	return &Processor{
 		s3Client:         s3Client,
 		sqsClient:        sqsClient,
-		tenantConfig:     tenant.NewConfigManager(dynamoClient, config.TenantConfigTable, logger),
+		tenantConfig:     tenant.NewConfigManager(dynamoClient, config.TenantConfigTable, logger).WithCacheTTL(time.Duration(config.TenantConfigCacheTTL) * time.Second),
 		cwDeliverer:      delivery.NewCloudWatchDeliverer(stsClient, config.CentralLogDistributionRoleArn, endpointURL, logger),
 		s3Deliverer:      delivery.NewS3Deliverer(stsClient, config.CentralLogDistributionRoleArn, config.S3UsePathStyle, endpointURL, logger),
 		metricsPublisher: awsmetrics.NewMetricsPublisher(cwClient, logger),
@@ -69,8 +69,12 @@ func (p *Processor) HandleLambdaEvent(ctx context.Context, event events.SQSEvent
 
 	p.logger.Info("processing SQS messages", "message_count", len(event.Records))
 
+	// Collect metrics for the whole batch so each tenant is published once rather than per record
+	metricsBatch := awsmetrics.NewMetricsBatch()
+	batchCtx := awsmetrics.WithMetricsBatch(ctx, metricsBatch)
+
 	for _, record := range event.Records {
-		deliveryStats, err := p.ProcessSQSRecord(ctx, record.Body, record.MessageId, record.ReceiptHandle)
+		deliveryStats, err := p.ProcessSQSRecord(batchCtx, record.Body, record.MessageId, record.ReceiptHandle)
 
 		if models.IsNonRecoverable(err) {
 			// Non-recoverable errors should not be retried
@@ -97,6 +101,10 @@ func (p *Processor) HandleLambdaEvent(ctx context.Context, event events.SQSEvent
 		}
 	}
 
+	if err := p.metricsPublisher.FlushMetricsBatch(ctx, metricsBatch); err != nil {
+		p.logger.Error("failed to write batched metrics to central CloudWatch instance", "error", err)
+	}
+
 	p.logger.Info("processing complete",
 		"successful_records", successfulRecords,
 		"failed_records", failedRecords,
@@ -125,8 +133,8 @@ func (p *Processor) ProcessSQSRecord(ctx context.Context, messageBody, messageID
 		return nil, models.NewInvalidS3NotificationError(fmt.Sprintf("invalid S3 event format: %v", err))
 	}
 
-	// Extract the processing metadata from message body
-	metadata, err := ExtractProcessingMetadata(messageBody)
+	// Decode the processing metadata captured alongside the SNS message, without re-parsing the body
+	metadata, err := DecodeProcessingMetadata(snsMessage.ProcessingMetadata)
 	if err != nil {
 		// Classify metadata extraction as a recoverable error: we wouldn't expect this to ever happen,
 		// so, if it fails on automatic retry, should end up in the dead-letter queue for examination
@@ -14,10 +14,18 @@ import (
 	"github.com/openshift/rosa-log-router/internal/models"
 )
 
+// clusterEnvironments maps cluster_id prefixes to environment names
+var clusterEnvironments = map[string]string{
+	"prod": "production",
+	"stg":  "staging",
+	"dev":  "development",
+}
+
 // ExtractTenantInfoFromKey extracts tenant information from S3 object key path
 // Expected format (from Vector): cluster_id/namespace/application/pod_name/timestamp-uuid.json.gz
 func ExtractTenantInfoFromKey(objectKey string, logger *slog.Logger) (*models.TenantInfo, error) {
-	pathParts := strings.Split(objectKey, "/")
+	// Only the first four segments are used; everything after them stays in the fifth part
+	pathParts := strings.SplitN(objectKey, "/", 5)
 
 	if len(pathParts) < 5 {
 		return nil, models.NewInvalidS3NotificationError(
@@ -55,14 +63,8 @@ func ExtractTenantInfoFromKey(objectKey string, logger *slog.Logger) (*models.Te
 	}
 
 	// Extract environment from cluster_id if it contains it
-	if strings.Contains(tenantInfo.ClusterID, "-") {
-		envPrefix := strings.Split(tenantInfo.ClusterID, "-")[0]
-		envMap := map[string]string{
-			"prod": "production",
-			"stg":  "staging",
-			"dev":  "development",
-		}
-		if env, ok := envMap[envPrefix]; ok {
+	if envPrefix, _, found := strings.Cut(tenantInfo.ClusterID, "-"); found {
+		if env, ok := clusterEnvironments[envPrefix]; ok {
 			tenantInfo.Environment = env
 		}
 	}
@@ -22,18 +22,29 @@ type SQSClientAPI interface {
 // ExtractProcessingMetadata extracts processing metadata from SQS record
 func ExtractProcessingMetadata(sqsRecordBody string) (*models.ProcessingMetadata, error) {
 	var message struct {
-		ProcessingMetadata *models.ProcessingMetadata `json:"processing_metadata"`
+		ProcessingMetadata json.RawMessage `json:"processing_metadata"`
 	}
 
 	if err := json.Unmarshal([]byte(sqsRecordBody), &message); err != nil {
 		return &models.ProcessingMetadata{}, fmt.Errorf("failed to extract metadata from SQS record: %w", err)
 	}
 
-	if message.ProcessingMetadata == nil {
+	return DecodeProcessingMetadata(message.ProcessingMetadata)
+}
+
+// DecodeProcessingMetadata decodes the raw processing_metadata value of an SQS record,
+// returning empty metadata when it is absent
+func DecodeProcessingMetadata(raw json.RawMessage) (*models.ProcessingMetadata, error) {
+	if len(raw) == 0 || string(raw) == "null" {
 		return &models.ProcessingMetadata{}, nil
 	}
 
-	return message.ProcessingMetadata, nil
+	var metadata models.ProcessingMetadata
+	if err := json.Unmarshal(raw, &metadata); err != nil {
+		return &models.ProcessingMetadata{}, fmt.Errorf("failed to extract metadata from SQS record: %w", err)
+	}
+
+	return &metadata, nil
 }
 
 // ShouldSkipProcessedEvents skips events that have already been processed based on offset
@@ -125,6 +125,36 @@ func TestExtractProcessingMetadata(t *testing.T) {
 	})
 }
 
+func TestDecodeProcessingMetadata(t *testing.T) {
+	t.Run("decodes metadata captured with the SNS message", func(t *testing.T) {
+		var snsMessage models.SNSMessage
+		err := json.Unmarshal([]byte(`{"Message": "test", "processing_metadata": {"offset": 7, "retry_count": 1}}`), &snsMessage)
+		require.NoError(t, err)
+
+		metadata, err := DecodeProcessingMetadata(snsMessage.ProcessingMetadata)
+
+		require.NoError(t, err)
+		assert.Equal(t, 7, metadata.Offset)
+		assert.Equal(t, 1, metadata.RetryCount)
+	})
+
+	t.Run("returns empty metadata when absent or null", func(t *testing.T) {
+		for _, raw := range []json.RawMessage{nil, json.RawMessage("null")} {
+			metadata, err := DecodeProcessingMetadata(raw)
+
+			require.NoError(t, err)
+			assert.Equal(t, &models.ProcessingMetadata{}, metadata)
+		}
+	})
+
+	t.Run("returns error for malformed metadata", func(t *testing.T) {
+		metadata, err := DecodeProcessingMetadata(json.RawMessage(`"not-an-object"`))
+
+		require.Error(t, err)
+		assert.Equal(t, 0, metadata.Offset)
+	})
+}
+
 func TestShouldSkipProcessedEvents(t *testing.T) {
 	logger := getTestLogger()
 
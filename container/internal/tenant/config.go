@@ -6,6 +6,8 @@ import (
 	"fmt"
 	"log/slog"
 	"strings"
+	"sync"
+	"time"
 
 	"github.com/aws/aws-sdk-go-v2/aws"
 	"github.com/aws/aws-sdk-go-v2/feature/dynamodb/attributevalue"
@@ -24,6 +26,18 @@ type ConfigManager struct {
 	client    DynamoDBQueryAPI
 	tableName string
 	logger    *slog.Logger
+
+	// Optional per-process memoization of lookups, enabled with WithCacheTTL
+	cacheTTL time.Duration
+	cacheMu  sync.Mutex
+	cache    map[string]cachedDeliveryConfigs
+	now      func() time.Time
+}
+
+// cachedDeliveryConfigs is a memoized successful GetEnabledDeliveryConfigs result
+type cachedDeliveryConfigs struct {
+	configs   []*models.DeliveryConfig
+	expiresAt time.Time
 }
 
 // NewConfigManager creates a new tenant configuration manager
@@ -35,8 +49,73 @@ func NewConfigManager(client DynamoDBQueryAPI, tableName string, logger *slog.Lo
 	}
 }
 
+// WithCacheTTL memoizes successful tenant lookups for the given duration so records for the same
+// tenant skip the DynamoDB round trip; a zero or negative TTL disables caching. Cached configs can
+// be up to ttl stale: a delivery config that is disabled, removed or changed keeps being used by
+// this process until its entry expires. Failed lookups (including tenant not found and no enabled
+// configs) are never cached, so a newly onboarded or re-enabled tenant is picked up immediately.
+func (cm *ConfigManager) WithCacheTTL(ttl time.Duration) *ConfigManager {
+	cm.cacheMu.Lock()
+	defer cm.cacheMu.Unlock()
+
+	cm.cacheTTL = ttl
+	cm.cache = make(map[string]cachedDeliveryConfigs)
+	return cm
+}
+
 // GetEnabledDeliveryConfigs retrieves all enabled delivery configurations for a tenant
 func (cm *ConfigManager) GetEnabledDeliveryConfigs(ctx context.Context, tenantID string) ([]*models.DeliveryConfig, error) {
+	if cm.cacheTTL <= 0 {
+		return cm.queryEnabledDeliveryConfigs(ctx, tenantID)
+	}
+
+	if entry, ok := cm.cachedLookup(tenantID); ok {
+		cm.logger.Debug("using cached delivery configs for tenant", "tenant_id", tenantID)
+		return entry.configs, nil
+	}
+
+	configs, err := cm.queryEnabledDeliveryConfigs(ctx, tenantID)
+	if err != nil {
+		// Not cached: the processor drops records on non-recoverable lookup errors, so caching
+		// "tenant not found" would lose logs for a tenant onboarded within the TTL
+		return nil, err
+	}
+
+	cm.cacheMu.Lock()
+	cm.cache[tenantID] = cachedDeliveryConfigs{
+		configs:   configs,
+		expiresAt: cm.clock().Add(cm.cacheTTL),
+	}
+	cm.cacheMu.Unlock()
+
+	return configs, nil
+}
+
+// cachedLookup returns the unexpired cache entry for a tenant, if any
+func (cm *ConfigManager) cachedLookup(tenantID string) (cachedDeliveryConfigs, bool) {
+	cm.cacheMu.Lock()
+	defer cm.cacheMu.Unlock()
+
+	entry, ok := cm.cache[tenantID]
+	if !ok {
+		return cachedDeliveryConfigs{}, false
+	}
+	if !cm.clock().Before(entry.expiresAt) {
+		delete(cm.cache, tenantID)
+		return cachedDeliveryConfigs{}, false
+	}
+	return entry, true
+}
+
+func (cm *ConfigManager) clock() time.Time {
+	if cm.now != nil {
+		return cm.now()
+	}
+	return time.Now()
+}
+
+// queryEnabledDeliveryConfigs loads and validates the enabled delivery configurations for a tenant from DynamoDB
+func (cm *ConfigManager) queryEnabledDeliveryConfigs(ctx context.Context, tenantID string) ([]*models.DeliveryConfig, error) {
 	// Handle empty tenant ID (from malformed S3 paths)
 	if tenantID == "" {
 		cm.logger.Warn("invalid tenant_id (empty string) for DynamoDB lookup - indicates malformed S3 path")
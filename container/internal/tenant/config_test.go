@@ -2,7 +2,9 @@ package tenant
 
 import (
 	"context"
+	"errors"
 	"testing"
+	"time"
 
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb"
 	"github.com/aws/aws-sdk-go-v2/service/dynamodb/types"
@@ -279,3 +281,107 @@ func TestGetTenantDeliveryConfigsDefaultEnabled(t *testing.T) {
 	assert.IsType(t, &models.TenantNotFoundError{}, err)
 	assert.Contains(t, err.Error(), "no enabled delivery configurations found for tenant")
 }
+
+func cachingTestClient(queries *int, items []map[string]types.AttributeValue, err error) *mockDynamoDBClient {
+	return &mockDynamoDBClient{
+		queryFunc: func(ctx context.Context, params *dynamodb.QueryInput, optFns ...func(*dynamodb.Options)) (*dynamodb.QueryOutput, error) {
+			*queries++
+			if err != nil {
+				return nil, err
+			}
+			return &dynamodb.QueryOutput{Items: items}, nil
+		},
+	}
+}
+
+var cachingTestItems = []map[string]types.AttributeValue{
+	{
+		"tenant_id":                 &types.AttributeValueMemberS{Value: "acme-corp"},
+		"type":                      &types.AttributeValueMemberS{Value: "cloudwatch"},
+		"log_distribution_role_arn": &types.AttributeValueMemberS{Value: "arn:aws:iam::987654321098:role/LogRole"},
+		"log_group_name":            &types.AttributeValueMemberS{Value: "/aws/logs/acme-corp"},
+		"target_region":             &types.AttributeValueMemberS{Value: "us-east-1"},
+	},
+}
+
+func TestGetTenantDeliveryConfigsCacheHit(t *testing.T) {
+	queries := 0
+	manager := NewConfigManager(cachingTestClient(&queries, cachingTestItems, nil), "test-tenant-configs", models.NewDefaultLogger()).
+		WithCacheTTL(time.Minute)
+
+	ctx := context.Background()
+	first, err := manager.GetEnabledDeliveryConfigs(ctx, "acme-corp")
+	require.NoError(t, err)
+	second, err := manager.GetEnabledDeliveryConfigs(ctx, "acme-corp")
+	require.NoError(t, err)
+
+	assert.Equal(t, 1, queries)
+	assert.Equal(t, first, second)
+}
+
+func TestGetTenantDeliveryConfigsDoesNotCacheTenantNotFound(t *testing.T) {
+	queries := 0
+	manager := NewConfigManager(cachingTestClient(&queries, nil, nil), "test-tenant-configs", models.NewDefaultLogger()).
+		WithCacheTTL(time.Minute)
+
+	ctx := context.Background()
+	for i := 0; i < 2; i++ {
+		_, err := manager.GetEnabledDeliveryConfigs(ctx, "nonexistent-tenant")
+		require.Error(t, err)
+		assert.IsType(t, &models.TenantNotFoundError{}, err)
+	}
+
+	// A tenant onboarded after a failed lookup must not stay "not found" until the TTL expires
+	assert.Equal(t, 2, queries)
+}
+
+func TestGetTenantDeliveryConfigsDoesNotCacheTransientErrors(t *testing.T) {
+	queries := 0
+	manager := NewConfigManager(cachingTestClient(&queries, nil, errors.New("throttled")), "test-tenant-configs", models.NewDefaultLogger()).
+		WithCacheTTL(time.Minute)
+
+	ctx := context.Background()
+	for i := 0; i < 2; i++ {
+		_, err := manager.GetEnabledDeliveryConfigs(ctx, "acme-corp")
+		require.Error(t, err)
+		assert.False(t, models.IsNonRecoverable(err))
+	}
+
+	assert.Equal(t, 2, queries)
+}
+
+func TestGetTenantDeliveryConfigsCacheExpiry(t *testing.T) {
+	queries := 0
+	now := time.Date(2024, 12, 1, 0, 0, 0, 0, time.UTC)
+	manager := NewConfigManager(cachingTestClient(&queries, cachingTestItems, nil), "test-tenant-configs", models.NewDefaultLogger()).
+		WithCacheTTL(time.Minute)
+	manager.now = func() time.Time { return now }
+
+	ctx := context.Background()
+	_, err := manager.GetEnabledDeliveryConfigs(ctx, "acme-corp")
+	require.NoError(t, err)
+
+	now = now.Add(59 * time.Second)
+	_, err = manager.GetEnabledDeliveryConfigs(ctx, "acme-corp")
+	require.NoError(t, err)
+	assert.Equal(t, 1, queries)
+
+	now = now.Add(time.Second)
+	_, err = manager.GetEnabledDeliveryConfigs(ctx, "acme-corp")
+	require.NoError(t, err)
+	assert.Equal(t, 2, queries)
+}
+
+func TestGetTenantDeliveryConfigsCacheDisabled(t *testing.T) {
+	queries := 0
+	manager := NewConfigManager(cachingTestClient(&queries, cachingTestItems, nil), "test-tenant-configs", models.NewDefaultLogger()).
+		WithCacheTTL(0)
+
+	ctx := context.Background()
+	for i := 0; i < 2; i++ {
+		_, err := manager.GetEnabledDeliveryConfigs(ctx, "acme-corp")
+		require.NoError(t, err)
+	}
+
+	assert.Equal(t, 2, queries)
+}
@@ -44,6 +44,7 @@ resource "aws_lambda_function" "log_distributor_function" {
       RETRY_ATTEMPTS                    = "3"
       CENTRAL_LOG_DISTRIBUTION_ROLE_ARN = var.central_log_distribution_role_arn
       SQS_QUEUE_URL                     = var.sqs_queue_url
+      TENANT_CONFIG_CACHE_TTL           = "60" # config changes (e.g. enabled=false) apply within this many seconds
     }
   }
 
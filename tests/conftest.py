@@ -5,32 +5,43 @@ import pytest
 import os
 import sys
 import boto3
+import orjson
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
 from moto import mock_aws
+from types import MappingProxyType
 
-# Add API source path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../api'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../api/src'))
+# Add API and container source paths for imports once for every test module
+for _path in ('../container', '../api', '../api/src'):
+    _path = os.path.abspath(os.path.join(os.path.dirname(__file__), _path))
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 
-@pytest.fixture
-def aws_credentials():
-    """Mocked AWS Credentials for moto."""
-    os.environ['AWS_ACCESS_KEY_ID'] = 'testing'
-    os.environ['AWS_SECRET_ACCESS_KEY'] = 'testing'
-    os.environ['AWS_SECURITY_TOKEN'] = 'testing'
-    os.environ['AWS_SESSION_TOKEN'] = 'testing'
-    os.environ['AWS_DEFAULT_REGION'] = 'us-east-1'
-
+# Canonical sample configs, built once. Read-only views so a test that mutates one fails loudly
+# instead of leaking into later tests. desired_logs stays a list: that is what DynamoDB returns.
+SAMPLE_CLOUDWATCH_CONFIG = MappingProxyType({
+    "tenant_id": "test-tenant",
+    "type": "cloudwatch",
+    "log_distribution_role_arn": "arn:aws:iam::123456789012:role/TestRole",
+    "log_group_name": "/aws/logs/test-tenant",
+    "target_region": "us-east-1",
+    "enabled": True,
+    "desired_logs": ["app1", "app2"]
+})
 
-@pytest.fixture
-def mock_aws_services(aws_credentials):
-    """Mock all AWS services."""
-    with mock_aws():
-        yield
+SAMPLE_S3_CONFIG = MappingProxyType({
+    "tenant_id": "test-tenant",
+    "type": "s3",
+    "bucket_name": "test-bucket",
+    "bucket_prefix": "ROSA/cluster-logs/",
+    "target_region": "us-east-1",
+    "enabled": True
+})
 
 
 @pytest.fixture
-def environment_variables():
+def environment_variables(monkeypatch):
     """Set up test environment variables."""
     test_env = {
         'TENANT_CONFIG_TABLE': 'test-tenant-configs',
@@ -40,34 +51,18 @@ def environment_variables():
         'RETRY_ATTEMPTS': '3',
         'SQS_QUEUE_URL': 'https://sqs.us-east-1.amazonaws.com/123456789012/test-queue'
     }
-    
-    # Store original values
-    original_env = {}
     for key, value in test_env.items():
-        original_env[key] = os.environ.get(key)
-        os.environ[key] = value
-    
-    yield test_env
-    
-    # Restore original values
-    for key, value in original_env.items():
-        if value is None:
-            os.environ.pop(key, None)
-        else:
-            os.environ[key] = value
+        monkeypatch.setenv(key, value)
+    return test_env
 
 
 # API-specific fixtures below
 
-@pytest.fixture(scope="function")
-def dynamodb_table(aws_credentials):
-    """Create a mocked DynamoDB table for testing with composite key schema"""
-    with mock_aws():
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-        
-        # Create the table with composite key (tenant_id + type)
+def _create_tenant_config_table(dynamodb, table_name):
+    """Create the tenant config table with composite key (tenant_id + type), reusing it if it exists"""
+    try:
         table = dynamodb.create_table(
-            TableName="test-tenant-configs",
+            TableName=table_name,
             KeySchema=[
                 {"AttributeName": "tenant_id", "KeyType": "HASH"},
                 {"AttributeName": "type", "KeyType": "RANGE"}
@@ -78,46 +73,142 @@ def dynamodb_table(aws_credentials):
             ],
             BillingMode="PAY_PER_REQUEST"
         )
-        
-        yield table
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ResourceInUseException":
+            raise
+        table = dynamodb.Table(table_name)
+    table.wait_until_exists()
+    return table
+
+
+def _empty_table(table):
+    """Delete every item in the tenant config table, page by page"""
+    scan_kwargs = {"ProjectionExpression": "tenant_id, #type", "ExpressionAttributeNames": {"#type": "type"}}
+    with table.batch_writer() as batch:
+        while True:
+            page = table.scan(**scan_kwargs)
+            for key in page["Items"]:
+                batch.delete_item(Key=key)
+            if "LastEvaluatedKey" not in page:
+                break
+            scan_kwargs["ExclusiveStartKey"] = page["LastEvaluatedKey"]
+
+
+@pytest.fixture(scope="session")
+def _dynamodb_table():
+    """Create the DynamoDB tenant config table once per session.
+
+    Backed by moto unless LOCALSTACK_ENDPOINT is set (e.g. http://localhost:4566 after `make start`),
+    in which case each xdist worker gets its own table in that LocalStack, kept across runs.
+    """
+    endpoint_url = os.environ.get('LOCALSTACK_ENDPOINT')
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('AWS_DEFAULT_REGION', 'us-east-1')
+        if endpoint_url:
+            dynamodb = boto3.resource("dynamodb", region_name="us-east-1", endpoint_url=endpoint_url)
+            worker = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+            table = _create_tenant_config_table(dynamodb, f"test-tenant-configs-{worker}")
+            # A persisted table may still hold items from an interrupted run
+            _empty_table(table)
+            yield table
+        else:
+            with mock_aws():
+                dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+                yield _create_tenant_config_table(dynamodb, "test-tenant-configs")
 
 
 @pytest.fixture(scope="function")
-def delivery_config_service(dynamodb_table):
-    """Create a TenantDeliveryConfigService instance with mocked DynamoDB"""
+def dynamodb_table(_dynamodb_table):
+    """The session DynamoDB table, emptied after each test instead of being re-created"""
+    yield _dynamodb_table
+    _empty_table(_dynamodb_table)
+
+
+@pytest.fixture(scope="session")
+def _delivery_config_service(_dynamodb_table):
+    """Create one TenantDeliveryConfigService bound to the session's DynamoDB table"""
     try:
         from src.services.dynamo import TenantDeliveryConfigService
-        return TenantDeliveryConfigService(table_name="test-tenant-configs", region="us-east-1")
     except ImportError:
         # If API modules aren't available, skip
         pytest.skip("API modules not available")
+    service = TenantDeliveryConfigService(table_name=_dynamodb_table.name, region="us-east-1")
+    # Reuse the table's boto3 resource instead of letting the service build its own
+    service._table = _dynamodb_table
+    return service
+
+
+@pytest.fixture(scope="function")
+def delivery_config_service(dynamodb_table, _delivery_config_service):
+    """TenantDeliveryConfigService with mocked DynamoDB; the table is emptied after each test"""
+    return _delivery_config_service
+
+
+@pytest.fixture(scope="session")
+def _stubbed_delivery_config_service():
+    """Create one TenantDeliveryConfigService on a DynamoDB client meant to be stubbed, never called"""
+    try:
+        from src.services.dynamo import TenantDeliveryConfigService
+    except ImportError:
+        pytest.skip("API modules not available")
+    table = boto3.resource('dynamodb', region_name='us-east-1').Table('stubbed-tenant-configs')
+    service = TenantDeliveryConfigService(table_name=table.name, region="us-east-1")
+    service._table = table
+    return service
+
+
+@pytest.fixture
+def stubbed_delivery_config_service(_stubbed_delivery_config_service):
+    """TenantDeliveryConfigService whose DynamoDB calls are answered by a botocore Stubber.
+
+    Yields (service, stubber). Queue a canned response per call with stubber.add_response;
+    nothing reaches moto or the network. For tests of pure logic that need no stored state.
+    """
+    with Stubber(_stubbed_delivery_config_service.table.meta.client) as stubber:
+        yield _stubbed_delivery_config_service, stubber
+        stubber.assert_no_pending_responses()
 
 
 @pytest.fixture
 def sample_cloudwatch_config():
-    """Sample CloudWatch delivery config for testing"""
+    """Sample CloudWatch delivery config for testing (read-only; copy with {**config} to change it)"""
+    return SAMPLE_CLOUDWATCH_CONFIG
+
+
+@pytest.fixture(scope="session")
+def valid_cloudwatch_config():
+    """Valid CloudWatch delivery config request body (shared; do not mutate)"""
     return {
-        "tenant_id": "test-tenant",
+        "tenant_id": "new-tenant",
         "type": "cloudwatch",
-        "log_distribution_role_arn": "arn:aws:iam::123456789012:role/TestRole",
-        "log_group_name": "/aws/logs/test-tenant",
-        "target_region": "us-east-1",
-        "enabled": True,
-        "desired_logs": ["app1", "app2"]
+        "log_distribution_role_arn": "arn:aws:iam::123456789012:role/NewRole",
+        "log_group_name": "/aws/logs/new-tenant",
+        "target_region": "us-east-1"
     }
 
 
+@pytest.fixture(scope="session")
+def invalid_arn_config(valid_cloudwatch_config):
+    """CloudWatch delivery config request body with a malformed role ARN"""
+    return {**valid_cloudwatch_config, "log_distribution_role_arn": "invalid-arn"}
+
+
+@pytest.fixture(scope="session")
+def valid_cloudwatch_config_bytes(valid_cloudwatch_config):
+    """valid_cloudwatch_config serialized once as a JSON request body"""
+    return orjson.dumps(valid_cloudwatch_config)
+
+
+@pytest.fixture(scope="session")
+def incomplete_config():
+    """CloudWatch delivery config request body missing its required fields"""
+    return {"tenant_id": "incomplete-tenant", "type": "cloudwatch"}
+
+
 @pytest.fixture
 def sample_s3_config():
-    """Sample S3 delivery config for testing"""
-    return {
-        "tenant_id": "test-tenant",
-        "type": "s3",
-        "bucket_name": "test-bucket",
-        "bucket_prefix": "ROSA/cluster-logs/",
-        "target_region": "us-east-1",
-        "enabled": True
-    }
+    """Sample S3 delivery config for testing (read-only; copy with {**config} to change it)"""
+    return SAMPLE_S3_CONFIG
 
 
 @pytest.fixture
@@ -160,9 +251,18 @@ def multiple_delivery_configs():
     ]
 
 
+@pytest.fixture
+def created_cloudwatch_config(delivery_config_service, sample_cloudwatch_config):
+    """The sample CloudWatch delivery config, already stored through the service"""
+    delivery_config_service.create_tenant_config(sample_cloudwatch_config)
+    return sample_cloudwatch_config
+
+
 @pytest.fixture
 def populated_delivery_configs(delivery_config_service, multiple_delivery_configs):
     """A delivery config service with pre-populated test data"""
-    for config in multiple_delivery_configs:
-        delivery_config_service.create_tenant_config(config)
+    # One batched write instead of a conditional put per config; the table is empty at this point
+    with delivery_config_service.table.batch_writer() as batch:
+        for config in multiple_delivery_configs:
+            batch.put_item(Item=delivery_config_service._apply_defaults(config))
     return delivery_config_service
\ No newline at end of file
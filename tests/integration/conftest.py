@@ -15,9 +15,11 @@ import requests
 from contextlib import closing
 from typing import Generator, Dict, Any
 
-# Add API source path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../api'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../api/src'))
+# Add API source path for imports (no-op when tests/conftest.py already added it)
+for _path in ('../../api', '../../api/src'):
+    _path = os.path.abspath(os.path.join(os.path.dirname(__file__), _path))
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 
 def find_free_port() -> int:
@@ -29,6 +31,22 @@ def find_free_port() -> int:
     return port
 
 
+@pytest.fixture(scope="session", autouse=True)
+def warm_boto3_service_models():
+    """Load botocore service models once before the first test needs a client
+
+    The default boto3 session caches parsed models, so later clients created
+    by fixtures skip the cold JSON load. No request is sent.
+    """
+    for service_name in ('s3', 'dynamodb'):
+        boto3.client(
+            service_name,
+            region_name='us-east-1',
+            aws_access_key_id='test',
+            aws_secret_access_key='test'
+        )
+
+
 @pytest.fixture(scope="session")
 def dynamodb_local_port() -> int:
     """Get a free port for DynamoDB Local access"""
@@ -3,95 +3,106 @@
 Test data generator for SQS message handling scenarios
 """
 
-import json
+import functools
 import sys
 
+import orjson
+
 # Test case 1: Valid SQS message with existing tenant
-VALID_MESSAGE_EXISTING_TENANT = {
-    "Message": json.dumps({
-        "Records": [
-            {
-                "s3": {
-                    "bucket": {"name": "multi-tenant-logging-development-central-12345678"},
-                    "object": {"key": "test-cluster/test-customer/payment-service/payment-pod-123/20240101-test.json.gz"}
+@functools.cache
+def valid_message_existing_tenant():
+    return {
+        "Message": orjson.dumps({
+            "Records": [
+                {
+                    "s3": {
+                        "bucket": {"name": "multi-tenant-logging-development-central-12345678"},
+                        "object": {"key": "test-cluster/test-customer/payment-service/payment-pod-123/20240101-test.json.gz"}
+                    }
                 }
-            }
-        ]
-    })
-}
+            ]
+        }).decode()
+    }
 
 # Test case 2: Valid SQS message with non-existent tenant (should be removed from queue)
-VALID_MESSAGE_NONEXISTENT_TENANT = {
-    "Message": json.dumps({
-        "Records": [
-            {
-                "s3": {
-                    "bucket": {"name": "multi-tenant-logging-development-central-12345678"},
-                    "object": {"key": "test-cluster/nonexistent-tenant/payment-service/payment-pod-123/20240101-test.json.gz"}
+@functools.cache
+def valid_message_nonexistent_tenant():
+    return {
+        "Message": orjson.dumps({
+            "Records": [
+                {
+                    "s3": {
+                        "bucket": {"name": "multi-tenant-logging-development-central-12345678"},
+                        "object": {"key": "test-cluster/nonexistent-tenant/payment-service/payment-pod-123/20240101-test.json.gz"}
+                    }
                 }
-            }
-        ]
-    })
-}
+            ]
+        }).decode()
+    }
 
 # Test case 3: Invalid SQS message format (should be removed from queue)
-INVALID_MESSAGE_FORMAT = {
-    "Message": "invalid json content here"
-}
+@functools.cache
+def invalid_message_format():
+    return {
+        "Message": "invalid json content here"
+    }
 
 # Test case 4: Valid JSON but missing required S3 fields (should be removed from queue)
-INVALID_S3_EVENT = {
-    "Message": json.dumps({
-        "Records": [
-            {
-                "s3": {
-                    "bucket": {"name": "test-bucket"}
-                    # Missing object key
+@functools.cache
+def invalid_s3_event():
+    return {
+        "Message": orjson.dumps({
+            "Records": [
+                {
+                    "s3": {
+                        "bucket": {"name": "test-bucket"}
+                        # Missing object key
+                    }
                 }
-            }
-        ]
-    })
-}
+            ]
+        }).decode()
+    }
 
 # Test case 5: Invalid object key format (should be removed from queue)
-INVALID_OBJECT_KEY = {
-    "Message": json.dumps({
-        "Records": [
-            {
-                "s3": {
-                    "bucket": {"name": "multi-tenant-logging-development-central-12345678"},
-                    "object": {"key": "invalid-key-format.json.gz"}  # Not enough path segments
+@functools.cache
+def invalid_object_key():
+    return {
+        "Message": orjson.dumps({
+            "Records": [
+                {
+                    "s3": {
+                        "bucket": {"name": "multi-tenant-logging-development-central-12345678"},
+                        "object": {"key": "invalid-key-format.json.gz"}  # Not enough path segments
+                    }
                 }
-            }
-        ]
-    })
-}
+            ]
+        }).decode()
+    }
 
 # Test case 6: Network/AWS error simulation (should be retried)
 # This would be a valid message but we'd simulate AWS SDK errors
 
+TEST_CASES = {
+    "existing-tenant": valid_message_existing_tenant,
+    "nonexistent-tenant": valid_message_nonexistent_tenant,
+    "invalid-format": invalid_message_format,
+    "invalid-s3-event": invalid_s3_event,
+    "invalid-object-key": invalid_object_key,
+}
+
 def print_test_case(name, data):
     """Print a test case in the format expected by the processor"""
     print(f"# Test case: {name}")
-    print(json.dumps(data))
+    print(orjson.dumps(data).decode())
     print()
 
 def main():
     if len(sys.argv) > 1:
         test_case = sys.argv[1]
-        if test_case == "existing-tenant":
-            print(json.dumps(VALID_MESSAGE_EXISTING_TENANT))
-        elif test_case == "nonexistent-tenant":
-            print(json.dumps(VALID_MESSAGE_NONEXISTENT_TENANT))
-        elif test_case == "invalid-format":
-            print(json.dumps(INVALID_MESSAGE_FORMAT))
-        elif test_case == "invalid-s3-event":
-            print(json.dumps(INVALID_S3_EVENT))
-        elif test_case == "invalid-object-key":
-            print(json.dumps(INVALID_OBJECT_KEY))
-        else:
+        if test_case not in TEST_CASES:
             print(f"Unknown test case: {test_case}")
             sys.exit(1)
+        sys.stdout.buffer.write(orjson.dumps(TEST_CASES[test_case]()) + b"\n")
     else:
         print("Available test cases:")
         print("  existing-tenant      - Valid message for existing tenant")
@@ -104,4 +115,4 @@ def main():
         print("Example: python3 test_data.py nonexistent-tenant | python3 ../container/log_processor.py --mode manual")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -6,11 +6,7 @@ from unittest.mock import patch, Mock, MagicMock
 from moto import mock_aws
 import boto3
 import botocore.exceptions
-
-# Import the module under test
-import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../container'))
 
 from log_processor import push_metrics
 
@@ -0,0 +1,67 @@
+"""
+Shared fixtures for API unit tests
+
+The app is imported inside the fixtures so that collecting or running non-API unit tests does
+not build the FastAPI app and its DynamoDB-backed service.
+"""
+import os
+from unittest.mock import create_autospec
+
+import pytest
+
+# Give helper assertions pytest's detailed failure output (test modules import it after this runs)
+pytest.register_assert_rewrite("tests.unit.helpers")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def aws_test_environment():
+    """Keep boto3 clients built by unit tests off the developer's AWS setup and fast to create.
+
+    Fake credentials, no config/credentials file reads and no instance metadata (IMDS) probing;
+    restored when the session ends.
+    """
+    test_env = {
+        'AWS_ACCESS_KEY_ID': 'testing',
+        'AWS_SECRET_ACCESS_KEY': 'testing',
+        'AWS_SECURITY_TOKEN': 'testing',
+        'AWS_SESSION_TOKEN': 'testing',
+        'AWS_CONFIG_FILE': os.devnull,
+        'AWS_SHARED_CREDENTIALS_FILE': os.devnull,
+        'AWS_EC2_METADATA_DISABLED': 'true',
+    }
+
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in test_env.items():
+            mp.setenv(key, value)
+        yield test_env
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def async_client(anyio_backend):
+    """One in-process ASGI client for the whole session; tests patch services, never app state.
+
+    ASGITransport calls the app directly, so there is no connection pool to tune here:
+    httpx ignores ``limits`` when a transport is supplied. Reusing this client is the win.
+    """
+    from httpx import ASGITransport, AsyncClient
+    from src.app import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def mock_service():
+    """Override the delivery config service dependency with a fresh autospecced mock for one test."""
+    from src.app import app, get_delivery_config_service
+    from src.services.dynamo import TenantDeliveryConfigService
+
+    service = create_autospec(TenantDeliveryConfigService, instance=True)
+    app.dependency_overrides[get_delivery_config_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(get_delivery_config_service, None)
@@ -0,0 +1,64 @@
+"""
+Helpers for calling API route handlers directly and checking responses in unit tests
+"""
+
+import inspect
+
+import orjson
+from fastapi import HTTPException
+from fastapi.params import Depends
+from fastapi.responses import JSONResponse
+
+
+async def call(endpoint_fn, **kwargs):
+    """Await a route handler in-process and return (status_code, body).
+
+    Routing, middleware and request parsing are skipped, so request bodies must be passed as
+    already-built request models. Depends() parameters not given in kwargs are resolved through
+    app.dependency_overrides (e.g. as installed by the mock_service fixture).
+    An HTTPException is returned as its status code and {"detail": ...}, as FastAPI would.
+    """
+    # Imported here so modules that only use the assertion helpers don't build the app
+    from src.app import app
+
+    for name, param in inspect.signature(endpoint_fn).parameters.items():
+        if name not in kwargs and isinstance(param.default, Depends):
+            dependency = param.default.dependency
+            kwargs[name] = app.dependency_overrides.get(dependency, dependency)()
+    try:
+        result = await endpoint_fn(**kwargs)
+    except HTTPException as e:
+        return e.status_code, {"detail": e.detail}
+    if isinstance(result, JSONResponse):
+        return result.status_code, orjson.loads(result.body)
+    return 200, result
+
+
+def assert_status(response, status):
+    """Assert the response status code without parsing the body."""
+    assert response.status_code == status, f"expected {status}, got {response.status_code}: {response.text}"
+
+
+def assert_ok(response, status=200):
+    """Assert the response status code and return the body, parsed once."""
+    assert_status(response, status)
+    return orjson.loads(response.content)
+
+
+def assert_json(response, expected_subset):
+    """Parse a response body once and assert it contains expected_subset; return the parsed body.
+
+    Nested dicts in expected_subset only need to be a subset of the matching nested dict.
+    """
+    data = orjson.loads(response.content)
+    _assert_subset(data, expected_subset, "body")
+    return data
+
+
+def _assert_subset(actual, expected, path):
+    for key, value in expected.items():
+        assert key in actual, f"{path}[{key!r}] missing"
+        if isinstance(value, dict) and isinstance(actual[key], dict):
+            _assert_subset(actual[key], value, f"{path}[{key!r}]")
+        else:
+            assert actual[key] == value, f"{path}[{key!r}]: {actual[key]!r} != {value!r}"
@@ -3,106 +3,91 @@ Unit tests for API endpoints
 """
 
 import hashlib
-import json
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../api'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../api/src'))
-
-from src.app import app
+from unittest.mock import Mock
+
+from src.app import (
+    list_all_delivery_configs, list_tenant_delivery_configs, get_tenant_delivery_config,
+    create_tenant_delivery_config, update_tenant_delivery_config, patch_tenant_delivery_config,
+    delete_tenant_delivery_config, validate_tenant_delivery_config
+)
+from src.models.tenant import (
+    TenantDeliveryConfigCreateRequest, TenantDeliveryConfigUpdateRequest, TenantDeliveryConfigPatchRequest
+)
 from src.services.dynamo import TenantNotFoundError, DynamoDBError
+from tests.unit.helpers import assert_json, assert_ok, call
 
 
-@pytest.fixture
-def client():
-    return TestClient(app)
-
-
-def _body_hash(data) -> str:
-    """Compute X-Body-SHA256 for a request body (dict → JSON bytes, str → utf-8 bytes)."""
-    if isinstance(data, dict):
-        raw = json.dumps(data, separators=(",", ":")).encode()
-    elif isinstance(data, str):
-        raw = data.encode()
-    else:
-        raw = data or b""
-    return hashlib.sha256(raw).hexdigest()
+pytestmark = pytest.mark.anyio
 
 
 def post_json(client, url, data):
-    """POST with auto X-Body-SHA256 header."""
-    raw = json.dumps(data).encode()
+    """POST a JSON body with its X-Body-SHA256 header.
+
+    data may be a JSON-serializable object or an already-serialized JSON body as bytes.
+    """
+    raw = data if isinstance(data, bytes) else orjson.dumps(data)
     return client.post(url, content=raw,
                        headers={"Content-Type": "application/json",
                                 "X-Body-SHA256": hashlib.sha256(raw).hexdigest()})
 
 
-def put_json(client, url, data):
-    """PUT with auto X-Body-SHA256 header."""
-    raw = json.dumps(data).encode()
-    return client.put(url, content=raw,
-                      headers={"Content-Type": "application/json",
-                               "X-Body-SHA256": hashlib.sha256(raw).hexdigest()})
+HEALTH_URL = "/api/v1/health"
+TENANT_CONFIGS_URL = "/api/v1/tenants/test-tenant/delivery-configs"
+NEW_TENANT_CONFIGS_URL = "/api/v1/tenants/new-tenant/delivery-configs"
 
+CONFIG_KEY = {"tenant_id": "test-tenant", "delivery_type": "cloudwatch"}
+MISSING_CONFIG_KEY = {"tenant_id": "nonexistent", "delivery_type": "cloudwatch"}
 
-def patch_json(client, url, data):
-    """PATCH with auto X-Body-SHA256 header."""
-    raw = json.dumps(data).encode()
-    return client.patch(url, content=raw,
-                        headers={"Content-Type": "application/json",
-                                 "X-Body-SHA256": hashlib.sha256(raw).hexdigest()})
+EXISTING_CONFIG = {
+    "tenant_id": "test-tenant", "type": "cloudwatch",
+    "log_distribution_role_arn": "arn:aws:iam::123456789012:role/TestRole",
+    "log_group_name": "/aws/logs/test-tenant", "target_region": "us-east-1", "enabled": True
+}
+
+
+@pytest.fixture
+def health_service_class(monkeypatch):
+    """Replace the service class the health check instantiates; its return_value is the service."""
+    service_class = Mock()
+    monkeypatch.setattr("src.services.dynamo.TenantDeliveryConfigService", service_class)
+    return service_class
 
 
 class TestHealthEndpoint:
-    @patch('src.services.dynamo.TenantDeliveryConfigService')
-    def test_health_check_success(self, mock_service_class, client):
-        mock_service = Mock()
-        mock_service.dynamodb.describe_table.return_value = {"Table": {"TableName": "test-table"}}
-        mock_service_class.return_value = mock_service
-        response = client.get("/api/v1/health")
+    async def test_health_check_success(self, health_service_class, async_client):
+        health_service_class.return_value.dynamodb.describe_table.return_value = {"Table": {"TableName": "test-table"}}
+        response = await async_client.get(HEALTH_URL)
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert data["checks"]["dynamodb"]["status"] == "healthy"
-
-    @patch('src.services.dynamo.TenantDeliveryConfigService')
-    def test_health_check_dynamodb_table_not_found(self, mock_service_class, client):
-        mock_service = Mock()
-        mock_service.dynamodb.meta.client.describe_table.side_effect = Exception("ResourceNotFoundException")
-        mock_service_class.return_value = mock_service
-        response = client.get("/api/v1/health")
+        assert_json(response, {"status": "healthy", "checks": {"dynamodb": {"status": "healthy"}}})
+
+    async def test_health_check_dynamodb_table_not_found(self, health_service_class, async_client):
+        describe_table = health_service_class.return_value.dynamodb.meta.client.describe_table
+        describe_table.side_effect = Exception("ResourceNotFoundException")
+        response = await async_client.get(HEALTH_URL)
         assert response.status_code == 200
-        data = response.json()
-        assert data["checks"]["dynamodb"]["status"] == "healthy"
-        assert data["checks"]["dynamodb"]["note"] == "table_not_exists_but_connection_ok"
-
-    @patch('src.services.dynamo.TenantDeliveryConfigService')
-    def test_health_check_dynamodb_connection_error(self, mock_service_class, client):
-        mock_service = Mock()
-        mock_service.dynamodb.meta.client.describe_table.side_effect = Exception("Connection timeout")
-        mock_service_class.return_value = mock_service
-        response = client.get("/api/v1/health")
+        assert_json(response, {"checks": {"dynamodb": {"status": "healthy",
+                                                       "note": "table_not_exists_but_connection_ok"}}})
+
+    async def test_health_check_dynamodb_connection_error(self, health_service_class, async_client):
+        describe_table = health_service_class.return_value.dynamodb.meta.client.describe_table
+        describe_table.side_effect = Exception("Connection timeout")
+        response = await async_client.get(HEALTH_URL)
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "degraded"
-        assert data["checks"]["dynamodb"]["status"] == "unhealthy"
-
-    @patch('src.services.dynamo.TenantDeliveryConfigService')
-    def test_health_check_service_initialization_error(self, mock_service_class, client):
-        mock_service_class.side_effect = Exception("Failed to initialize service")
-        response = client.get("/api/v1/health")
+        assert_json(response, {"status": "degraded", "checks": {"dynamodb": {"status": "unhealthy"}}})
+
+    async def test_health_check_service_initialization_error(self, health_service_class, async_client):
+        health_service_class.side_effect = Exception("Failed to initialize service")
+        response = await async_client.get(HEALTH_URL)
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "unhealthy"
-        assert data["checks"]["dynamodb"]["status"] == "unhealthy"
+        assert_json(response, {"status": "unhealthy", "checks": {"dynamodb": {"status": "unhealthy"}}})
 
 
 class TestDeliveryConfigEndpoints:
-    @patch('src.app.delivery_config_service')
-    def test_list_all_delivery_configs_success(self, mock_service, client):
+    """Status-code mapping and service calls, exercised by awaiting the route handlers directly."""
+
+    async def test_list_all_delivery_configs_success(self, mock_service):
         mock_service.list_tenant_configs.return_value = {
             "configurations": [{"tenant_id": "test-tenant", "type": "cloudwatch",
                                  "log_distribution_role_arn": "arn:aws:iam::123456789012:role/TestRole",
@@ -110,174 +95,132 @@ class TestDeliveryConfigEndpoints:
                                  "target_region": "us-east-1", "enabled": True}],
             "count": 1, "limit": 50
         }
-        response = client.get("/api/v1/delivery-configs")
-        assert response.status_code == 200
-        data = response.json()
+        status, data = await call(list_all_delivery_configs)
+        assert status == 200
         assert len(data["data"]["configurations"]) == 1
         mock_service.list_tenant_configs.assert_called_once_with(limit=50, last_key=None)
 
-    @patch('src.app.delivery_config_service')
-    def test_list_tenant_delivery_configs_success(self, mock_service, client):
+    async def test_list_tenant_delivery_configs_success(self, mock_service):
         mock_service.get_tenant_configs.return_value = [
             {"tenant_id": "test-tenant", "type": "cloudwatch",
              "log_distribution_role_arn": "arn:aws:iam::123456789012:role/TestRole",
              "log_group_name": "/aws/logs/test-tenant", "enabled": True}
         ]
-        response = client.get("/api/v1/tenants/test-tenant/delivery-configs")
-        assert response.status_code == 200
-        assert len(response.json()["data"]["configurations"]) == 1
+        status, data = await call(list_tenant_delivery_configs, tenant_id="test-tenant")
+        assert status == 200
+        assert len(data["data"]["configurations"]) == 1
 
-    @patch('src.app.delivery_config_service')
-    def test_list_all_delivery_configs_service_error(self, mock_service, client):
+    async def test_list_all_delivery_configs_service_error(self, mock_service):
         mock_service.list_tenant_configs.side_effect = DynamoDBError("Connection failed")
-        response = client.get("/api/v1/delivery-configs")
-        assert response.status_code == 500
-
-    @patch('src.app.delivery_config_service')
-    def test_get_delivery_config_success(self, mock_service, client):
-        mock_service.get_tenant_config.return_value = {
-            "tenant_id": "test-tenant", "type": "cloudwatch",
-            "log_distribution_role_arn": "arn:aws:iam::123456789012:role/TestRole",
-            "log_group_name": "/aws/logs/test-tenant", "target_region": "us-east-1", "enabled": True
-        }
-        response = client.get("/api/v1/tenants/test-tenant/delivery-configs/cloudwatch")
-        assert response.status_code == 200
-        assert response.json()["data"]["tenant_id"] == "test-tenant"
-
-    @patch('src.app.delivery_config_service')
-    def test_get_delivery_config_not_found(self, mock_service, client):
-        mock_service.get_tenant_config.side_effect = TenantNotFoundError("not found")
-        response = client.get("/api/v1/tenants/nonexistent/delivery-configs/cloudwatch")
-        assert response.status_code == 404
-
-    @patch('src.app.delivery_config_service')
-    def test_create_delivery_config_success(self, mock_service, client):
-        config_data = {"tenant_id": "new-tenant", "type": "cloudwatch",
-                       "log_distribution_role_arn": "arn:aws:iam::123456789012:role/NewRole",
-                       "log_group_name": "/aws/logs/new-tenant", "target_region": "us-east-1"}
-        mock_service.create_tenant_config.return_value = config_data
-        response = post_json(client, "/api/v1/tenants/new-tenant/delivery-configs", config_data)
+        status, _ = await call(list_all_delivery_configs)
+        assert status == 500
+
+    @pytest.mark.parametrize("handler, body, service_method, service_return, check", [
+        pytest.param(get_tenant_delivery_config, None, "get_tenant_config", EXISTING_CONFIG,
+                     lambda data: data["data"]["tenant_id"] == "test-tenant", id="get"),
+        pytest.param(update_tenant_delivery_config,
+                     TenantDeliveryConfigUpdateRequest(log_distribution_role_arn="arn:aws:iam::123456789012:role/UpdatedRole",
+                                                       log_group_name="/aws/logs/updated-tenant",
+                                                       target_region="us-west-2", enabled=False),
+                     "update_tenant_config",
+                     {**EXISTING_CONFIG, "log_distribution_role_arn": "arn:aws:iam::123456789012:role/UpdatedRole",
+                      "log_group_name": "/aws/logs/updated-tenant", "target_region": "us-west-2", "enabled": False},
+                     lambda data: data["data"]["enabled"] is False, id="update"),
+        pytest.param(patch_tenant_delivery_config, TenantDeliveryConfigPatchRequest(enabled=False),
+                     "patch_tenant_config", {**EXISTING_CONFIG, "enabled": False},
+                     lambda data: data["data"]["enabled"] is False, id="patch"),
+        pytest.param(delete_tenant_delivery_config, None, "delete_tenant_config", None,
+                     lambda data: "deleted" in data["message"].lower(), id="delete"),
+        pytest.param(validate_tenant_delivery_config, None, "validate_tenant_config",
+                     {"tenant_id": "test-tenant", "type": "cloudwatch", "valid": True,
+                      "checks": [{"field": "log_distribution_role_arn", "status": "ok", "message": "ok"},
+                                 {"field": "log_group_name", "status": "ok", "message": "ok"},
+                                 {"field": "target_region", "status": "ok", "message": "ok"}]},
+                     lambda data: data["data"]["valid"] is True, id="validate"),
+    ])
+    async def test_delivery_config_operation_success(self, mock_service, handler, body, service_method,
+                                                     service_return, check):
+        getattr(mock_service, service_method).return_value = service_return
+        body_kwargs = {"config_data": body} if body is not None else {}
+        status, data = await call(handler, **CONFIG_KEY, **body_kwargs)
+        assert status == 200
+        assert check(data)
+        expected_args = ("test-tenant", "cloudwatch") + ((body.model_dump(exclude_none=True),) if body is not None else ())
+        getattr(mock_service, service_method).assert_called_once_with(*expected_args)
+
+    @pytest.mark.parametrize("handler, body, service_method", [
+        pytest.param(get_tenant_delivery_config, None, "get_tenant_config", id="get"),
+        pytest.param(update_tenant_delivery_config, TenantDeliveryConfigUpdateRequest(enabled=False),
+                     "update_tenant_config", id="update"),
+        pytest.param(delete_tenant_delivery_config, None, "delete_tenant_config", id="delete"),
+        pytest.param(validate_tenant_delivery_config, None, "validate_tenant_config", id="validate"),
+    ])
+    async def test_delivery_config_operation_not_found(self, mock_service, handler, body, service_method):
+        getattr(mock_service, service_method).side_effect = TenantNotFoundError("not found")
+        body_kwargs = {"config_data": body} if body is not None else {}
+        status, _ = await call(handler, **MISSING_CONFIG_KEY, **body_kwargs)
+        assert status == 404
+
+    async def test_create_delivery_config_success(self, mock_service, async_client, valid_cloudwatch_config,
+                                                  valid_cloudwatch_config_bytes):
+        mock_service.create_tenant_config.return_value = valid_cloudwatch_config
+        response = await post_json(async_client, NEW_TENANT_CONFIGS_URL, valid_cloudwatch_config_bytes)
         assert response.status_code == 201
-        assert response.json()["data"]["tenant_id"] == "new-tenant"
+        assert_json(response, {"status": "success", "data": {"tenant_id": "new-tenant"}})
         mock_service.create_tenant_config.assert_called_once()
 
-    def test_create_delivery_config_invalid_data(self, client):
-        invalid_data = {"tenant_id": "new-tenant", "type": "cloudwatch",
-                        "log_distribution_role_arn": "invalid-arn",
-                        "log_group_name": "/aws/logs/new-tenant", "target_region": "us-east-1"}
-        response = post_json(client, "/api/v1/tenants/new-tenant/delivery-configs", invalid_data)
-        assert response.status_code == 422
-        assert "log_distribution_role_arn" in str(response.json()["detail"])
-
-    @patch('src.app.delivery_config_service')
-    def test_create_delivery_config_duplicate(self, mock_service, client):
+    async def test_create_delivery_config_duplicate(self, mock_service):
         mock_service.create_tenant_config.side_effect = DynamoDBError("Configuration already exists")
-        config_data = {"tenant_id": "existing-tenant", "type": "cloudwatch",
-                       "log_distribution_role_arn": "arn:aws:iam::123456789012:role/ExistingRole",
-                       "log_group_name": "/aws/logs/existing-tenant", "target_region": "us-east-1"}
-        response = post_json(client, "/api/v1/tenants/existing-tenant/delivery-configs", config_data)
-        assert response.status_code == 400
-        assert "already exists" in response.json()["detail"].lower()
-
-    @patch('src.app.delivery_config_service')
-    def test_update_delivery_config_success(self, mock_service, client):
-        updated_data = {"tenant_id": "test-tenant", "type": "cloudwatch",
-                        "log_distribution_role_arn": "arn:aws:iam::123456789012:role/UpdatedRole",
-                        "log_group_name": "/aws/logs/updated-tenant",
-                        "target_region": "us-west-2", "enabled": False}
-        mock_service.update_tenant_config.return_value = updated_data
-        update_request = {"log_distribution_role_arn": "arn:aws:iam::123456789012:role/UpdatedRole",
-                          "log_group_name": "/aws/logs/updated-tenant",
-                          "target_region": "us-west-2", "enabled": False}
-        response = put_json(client, "/api/v1/tenants/test-tenant/delivery-configs/cloudwatch", update_request)
-        assert response.status_code == 200
-        assert response.json()["data"]["enabled"] is False
-
-    @patch('src.app.delivery_config_service')
-    def test_update_delivery_config_not_found(self, mock_service, client):
-        mock_service.update_tenant_config.side_effect = TenantNotFoundError("not found")
-        response = put_json(client, "/api/v1/tenants/nonexistent/delivery-configs/cloudwatch", {"enabled": False})
-        assert response.status_code == 404
-
-    @patch('src.app.delivery_config_service')
-    def test_patch_delivery_config_success(self, mock_service, client):
-        patched_data = {"tenant_id": "test-tenant", "type": "cloudwatch",
-                        "log_distribution_role_arn": "arn:aws:iam::123456789012:role/TestRole",
-                        "log_group_name": "/aws/logs/test-tenant",
-                        "target_region": "us-east-1", "enabled": False}
-        mock_service.patch_tenant_config.return_value = patched_data
-        response = patch_json(client, "/api/v1/tenants/test-tenant/delivery-configs/cloudwatch", {"enabled": False})
-        assert response.status_code == 200
-        assert response.json()["data"]["enabled"] is False
-        mock_service.patch_tenant_config.assert_called_once_with("test-tenant", "cloudwatch", {"enabled": False})
-
-    @patch('src.app.delivery_config_service')
-    def test_delete_delivery_config_success(self, mock_service, client):
-        mock_service.delete_tenant_config.return_value = None
-        response = client.delete("/api/v1/tenants/test-tenant/delivery-configs/cloudwatch")
-        assert response.status_code == 200
-        assert "deleted" in response.json()["message"].lower()
-
-    @patch('src.app.delivery_config_service')
-    def test_delete_delivery_config_not_found(self, mock_service, client):
-        mock_service.delete_tenant_config.side_effect = TenantNotFoundError("not found")
-        response = client.delete("/api/v1/tenants/nonexistent/delivery-configs/cloudwatch")
-        assert response.status_code == 404
-
-    @patch('src.app.delivery_config_service')
-    def test_validate_delivery_config_success(self, mock_service, client):
-        mock_service.validate_tenant_config.return_value = {
-            "tenant_id": "test-tenant", "type": "cloudwatch", "valid": True,
-            "checks": [{"field": "log_distribution_role_arn", "status": "ok", "message": "ok"},
-                       {"field": "log_group_name", "status": "ok", "message": "ok"},
-                       {"field": "target_region", "status": "ok", "message": "ok"}]
-        }
-        response = client.get("/api/v1/tenants/test-tenant/delivery-configs/cloudwatch/validate")
-        assert response.status_code == 200
-        assert response.json()["data"]["valid"] is True
-
-    @patch('src.app.delivery_config_service')
-    def test_validate_delivery_config_invalid(self, mock_service, client):
+        config_data = TenantDeliveryConfigCreateRequest(
+            tenant_id="existing-tenant", type="cloudwatch",
+            log_distribution_role_arn="arn:aws:iam::123456789012:role/ExistingRole",
+            log_group_name="/aws/logs/existing-tenant", target_region="us-east-1")
+        status, data = await call(create_tenant_delivery_config, tenant_id="existing-tenant", config_data=config_data)
+        assert status == 400
+        assert "already exists" in data["detail"].lower()
+
+    async def test_validate_delivery_config_invalid(self, mock_service):
         mock_service.validate_tenant_config.return_value = {
             "tenant_id": "invalid-tenant", "type": "cloudwatch", "valid": False,
             "checks": [{"field": "log_distribution_role_arn", "status": "invalid", "message": "invalid"},
                        {"field": "log_group_name", "status": "missing", "message": "missing"}]
         }
-        response = client.get("/api/v1/tenants/invalid-tenant/delivery-configs/cloudwatch/validate")
-        assert response.status_code == 200
-        assert response.json()["data"]["valid"] is False
-
-    @patch('src.app.delivery_config_service')
-    def test_validate_delivery_config_not_found(self, mock_service, client):
-        mock_service.validate_tenant_config.side_effect = TenantNotFoundError("not found")
-        response = client.get("/api/v1/tenants/nonexistent/delivery-configs/cloudwatch/validate")
-        assert response.status_code == 404
+        status, data = await call(validate_tenant_delivery_config, tenant_id="invalid-tenant", delivery_type="cloudwatch")
+        assert status == 200
+        assert data["data"]["valid"] is False
 
 
 class TestErrorHandling:
-    def test_invalid_json_body(self, client):
+    async def test_invalid_json_body(self, async_client):
         """POST with invalid JSON — middleware passes (hash matches bytes sent), FastAPI rejects with 422."""
         raw = b"invalid json"
-        response = client.post(
-            "/api/v1/tenants/test-tenant/delivery-configs",
+        response = await async_client.post(
+            TENANT_CONFIGS_URL,
             content=raw,
             headers={"Content-Type": "application/json",
                      "X-Body-SHA256": hashlib.sha256(raw).hexdigest()}
         )
         assert response.status_code == 422
 
-    def test_missing_required_fields(self, client):
-        incomplete_data = {"tenant_id": "incomplete-tenant", "type": "cloudwatch"}
-        response = post_json(client, "/api/v1/tenants/incomplete-tenant/delivery-configs", incomplete_data)
-        assert response.status_code == 422
-        error_details = str(response.json()["detail"])
-        assert any(f in error_details for f in ["log_distribution_role_arn", "log_group_name"])
-
-    def test_post_missing_body_hash_header_returns_400(self, client):
+    @pytest.mark.parametrize("payload_fixture, overrides, expected_field", [
+        pytest.param("invalid_arn_config", {}, "log_distribution_role_arn", id="invalid-arn"),
+        pytest.param("incomplete_config", {}, "log_distribution_role_arn", id="missing-required-fields"),
+        pytest.param("valid_cloudwatch_config", {"desired_logs": [""]}, "desired_logs", id="invalid-desired-logs"),
+        pytest.param("valid_cloudwatch_config", {"tenant_id": "bad tenant!"}, "tenant_id", id="invalid-tenant-id"),
+    ])
+    async def test_create_request_validation_error(self, request, async_client, payload_fixture, overrides,
+                                                   expected_field):
+        """POST bodies that fail request model validation are rejected with 422 naming the bad field."""
+        payload = {**request.getfixturevalue(payload_fixture), **overrides}
+        response = await post_json(async_client, NEW_TENANT_CONFIGS_URL, payload)
+        detail = assert_ok(response, 422)["detail"]
+        # Field validators name the field in loc; model validators report loc ["body"] and name it in msg
+        assert any(expected_field in error["loc"] or expected_field in error["msg"] for error in detail), detail
+
+    async def test_post_missing_body_hash_header_returns_400(self, async_client):
         """POST without X-Body-SHA256 header must be rejected by middleware."""
-        response = client.post(
-            "/api/v1/tenants/test-tenant/delivery-configs",
+        response = await async_client.post(
+            TENANT_CONFIGS_URL,
             json={"tenant_id": "test-tenant", "type": "cloudwatch"}
         )
-        assert response.status_code == 400
-        assert "X-Body-SHA256" in response.json()["error"]
+        assert "X-Body-SHA256" in assert_ok(response, 400)["error"]
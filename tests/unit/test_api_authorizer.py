@@ -8,10 +8,6 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, patch
 from botocore.exceptions import ClientError
 
-import sys, os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../api'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../api/src'))
-
 from src.handlers.authorizer import lambda_handler, generate_policy
 from src.utils.auth import (
     get_psk_from_secrets_manager, generate_signature, compute_body_hash,
@@ -3,25 +3,30 @@ Unit tests for DynamoDB tenant service
 """
 
 import pytest
+from boto3.dynamodb.types import TypeSerializer
 from botocore.exceptions import ClientError
-
-# Setup path for importing API modules
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../api'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../api/src'))
+from botocore.stub import ANY
 
 from src.services.dynamo import TenantDeliveryConfigService, TenantNotFoundError, DynamoDBError
 
 
+SERIALIZER = TypeSerializer()
+
+
+def stub_get_item(stubber, table_name, item=None):
+    """Queue a GetItem response returning item (or no item), marshalled the way DynamoDB sends it"""
+    response = {}
+    if item is not None:
+        response['Item'] = {key: SERIALIZER.serialize(value) for key, value in item.items()}
+    # The key is not pinned: the table resource may already have marshalled it when the stubber checks
+    stubber.add_response('get_item', response, {'TableName': table_name, 'Key': ANY})
+
+
 class TestTenantDeliveryConfigService:
     """Test cases for TenantDeliveryConfigService class"""
     
-    def test_get_tenant_config_success(self, delivery_config_service, sample_cloudwatch_config):
+    def test_get_tenant_config_success(self, delivery_config_service, created_cloudwatch_config):
         """Test successful delivery config retrieval"""
-        # Create a delivery config first
-        delivery_config_service.create_tenant_config(sample_cloudwatch_config)
-        
         # Retrieve the config
         result = delivery_config_service.get_tenant_config("test-tenant", "cloudwatch")
         
@@ -33,10 +38,15 @@ class TestTenantDeliveryConfigService:
         assert result["enabled"] is True
         assert result["desired_logs"] == ["app1", "app2"]
     
-    def test_get_tenant_config_not_found(self, delivery_config_service):
-        """Test delivery config retrieval when config doesn't exist"""
+    @pytest.mark.parametrize("method, extra_args", [
+        pytest.param("get_tenant_config", (), id="get"),
+        pytest.param("update_tenant_config", ({"enabled": False},), id="update"),
+        pytest.param("delete_tenant_config", (), id="delete"),
+    ])
+    def test_tenant_config_operation_not_found(self, delivery_config_service, method, extra_args):
+        """Test delivery config operations when config doesn't exist"""
         with pytest.raises(TenantNotFoundError, match="Tenant 'nonexistent' delivery configuration 'cloudwatch' not found"):
-            delivery_config_service.get_tenant_config("nonexistent", "cloudwatch")
+            getattr(delivery_config_service, method)("nonexistent", "cloudwatch", *extra_args)
     
     def test_create_tenant_config_success(self, delivery_config_service, sample_cloudwatch_config):
         """Test successful delivery config creation"""
@@ -45,11 +55,6 @@ class TestTenantDeliveryConfigService:
         assert result["tenant_id"] == "test-tenant"
         assert result["type"] == "cloudwatch"
         assert result["enabled"] is True  # Default value should be set
-        
-        # Verify config was actually created
-        retrieved = delivery_config_service.get_tenant_config("test-tenant", "cloudwatch")
-        assert retrieved["tenant_id"] == "test-tenant"
-        assert retrieved["type"] == "cloudwatch"
     
     def test_create_s3_config_success(self, delivery_config_service, sample_s3_config):
         """Test successful S3 delivery config creation"""
@@ -71,39 +76,25 @@ class TestTenantDeliveryConfigService:
         with pytest.raises(DynamoDBError, match="already exists"):
             delivery_config_service.create_tenant_config(sample_cloudwatch_config)
     
-    def test_update_tenant_config_success(self, delivery_config_service, sample_cloudwatch_config):
-        """Test successful delivery config update"""
-        # Create config first
-        delivery_config_service.create_tenant_config(sample_cloudwatch_config)
-        
-        # Update config
-        update_data = {
-            "log_group_name": "/aws/logs/updated-tenant",
-            "enabled": False,
-            "desired_logs": ["new-app"]
-        }
-        
-        result = delivery_config_service.update_tenant_config("test-tenant", "cloudwatch", update_data)
-        
-        assert result["tenant_id"] == "test-tenant"
-        assert result["type"] == "cloudwatch"
-        assert result["log_group_name"] == "/aws/logs/updated-tenant"
-        assert result["enabled"] is False
-        assert result["desired_logs"] == ["new-app"]
+    @pytest.mark.parametrize("method, changes", [
+        pytest.param("update_tenant_config",
+                     {"log_group_name": "/aws/logs/updated-tenant", "enabled": False, "desired_logs": ["new-app"]},
+                     id="update"),
+        pytest.param("patch_tenant_config", {"enabled": False}, id="patch"),
+    ])
+    def test_modify_tenant_config_success(self, delivery_config_service, created_cloudwatch_config, method, changes):
+        """Test successful delivery config update and patch (partial update)"""
+        result = getattr(delivery_config_service, method)("test-tenant", "cloudwatch", changes)
+        
+        for field, value in changes.items():
+            assert result[field] == value
         # Other fields should remain unchanged
-        assert result["log_distribution_role_arn"] == "arn:aws:iam::123456789012:role/TestRole"
+        for field, value in created_cloudwatch_config.items():
+            if field not in changes:
+                assert result[field] == value
     
-    def test_update_tenant_config_not_found(self, delivery_config_service):
-        """Test delivery config update when config doesn't exist"""
-        update_data = {"enabled": False}
-        
-        with pytest.raises(TenantNotFoundError, match="Tenant 'nonexistent' delivery configuration 'cloudwatch' not found"):
-            delivery_config_service.update_tenant_config("nonexistent", "cloudwatch", update_data)
-    
-    def test_update_tenant_config_no_fields(self, delivery_config_service, sample_cloudwatch_config):
+    def test_update_tenant_config_no_fields(self, delivery_config_service, created_cloudwatch_config):
         """Test delivery config update with no fields to update (should still update timestamp)"""
-        delivery_config_service.create_tenant_config(sample_cloudwatch_config)
-        
         # Even with empty update data, should succeed because updated_at is always added
         result = delivery_config_service.update_tenant_config("test-tenant", "cloudwatch", {})
         
@@ -111,28 +102,8 @@ class TestTenantDeliveryConfigService:
         assert result["type"] == "cloudwatch"
         assert "updated_at" in result
     
-    def test_patch_tenant_config_success(self, delivery_config_service, sample_cloudwatch_config):
-        """Test successful delivery config patch (partial update)"""
-        # Create config first
-        delivery_config_service.create_tenant_config(sample_cloudwatch_config)
-        
-        # Patch config
-        patch_data = {"enabled": False}
-        
-        result = delivery_config_service.patch_tenant_config("test-tenant", "cloudwatch", patch_data)
-        
-        assert result["tenant_id"] == "test-tenant"
-        assert result["type"] == "cloudwatch"
-        assert result["enabled"] is False
-        # Other fields should remain unchanged
-        assert result["log_group_name"] == "/aws/logs/test-tenant"
-        assert result["desired_logs"] == ["app1", "app2"]
-    
-    def test_delete_tenant_config_success(self, delivery_config_service, sample_cloudwatch_config):
+    def test_delete_tenant_config_success(self, delivery_config_service, created_cloudwatch_config):
         """Test successful delivery config deletion"""
-        # Create config first
-        delivery_config_service.create_tenant_config(sample_cloudwatch_config)
-        
         # Delete config
         result = delivery_config_service.delete_tenant_config("test-tenant", "cloudwatch")
         assert result is True
@@ -141,11 +112,6 @@ class TestTenantDeliveryConfigService:
         with pytest.raises(TenantNotFoundError):
             delivery_config_service.get_tenant_config("test-tenant", "cloudwatch")
     
-    def test_delete_tenant_config_not_found(self, delivery_config_service):
-        """Test delivery config deletion when config doesn't exist"""
-        with pytest.raises(TenantNotFoundError, match="Tenant 'nonexistent' delivery configuration 'cloudwatch' not found"):
-            delivery_config_service.delete_tenant_config("nonexistent", "cloudwatch")
-    
     def test_get_tenant_configs_success(self, delivery_config_service, sample_cloudwatch_config, sample_s3_config):
         """Test getting all delivery configs for a tenant"""
         # Create both CloudWatch and S3 configs for the same tenant
@@ -166,8 +132,7 @@ class TestTenantDeliveryConfigService:
         delivery_config_service.create_tenant_config(sample_cloudwatch_config)
         
         # Create disabled S3 config
-        sample_s3_config["enabled"] = False
-        delivery_config_service.create_tenant_config(sample_s3_config)
+        delivery_config_service.create_tenant_config({**sample_s3_config, "enabled": False})
         
         # Get enabled configs for the tenant
         result = delivery_config_service.get_enabled_tenant_configs("test-tenant")
@@ -185,11 +150,29 @@ class TestTenantDeliveryConfigService:
         assert result["limit"] == 50
         assert "last_key" not in result
     
-    def test_validate_tenant_config_valid_cloudwatch(self, delivery_config_service, sample_cloudwatch_config):
+    def test_list_tenant_configs_paginates_with_last_key(self, populated_delivery_configs, multiple_delivery_configs):
+        """Test listing delivery configs page by page by following the returned last_key cursor"""
+        seen = []
+        last_key = None
+        while True:
+            result = populated_delivery_configs.list_tenant_configs(limit=2, last_key=last_key)
+            assert result["count"] <= 2
+            seen.extend((config["tenant_id"], config["type"]) for config in result["configurations"])
+            if "last_key" not in result:
+                break
+            # Same "tenant_id#type" cursor format the API parses back into an ExclusiveStartKey
+            tenant_id, delivery_type = result["last_key"].split("#", 1)
+            last_key = {"tenant_id": tenant_id, "type": delivery_type}
+        
+        assert len(seen) == len(set(seen))
+        assert set(seen) == {(config["tenant_id"], config["type"]) for config in multiple_delivery_configs}
+    
+    def test_validate_tenant_config_valid_cloudwatch(self, stubbed_delivery_config_service, sample_cloudwatch_config):
         """Test delivery configuration validation for valid CloudWatch config"""
-        delivery_config_service.create_tenant_config(sample_cloudwatch_config)
+        service, stubber = stubbed_delivery_config_service
+        stub_get_item(stubber, service.table_name, sample_cloudwatch_config)
         
-        result = delivery_config_service.validate_tenant_config("test-tenant", "cloudwatch")
+        result = service.validate_tenant_config("test-tenant", "cloudwatch")
         
         assert result["tenant_id"] == "test-tenant"
         assert result["type"] == "cloudwatch"
@@ -201,11 +184,12 @@ class TestTenantDeliveryConfigService:
         assert "log_distribution_role_arn" in check_fields
         assert "log_group_name" in check_fields
     
-    def test_validate_tenant_config_valid_s3(self, delivery_config_service, sample_s3_config):
+    def test_validate_tenant_config_valid_s3(self, stubbed_delivery_config_service, sample_s3_config):
         """Test delivery configuration validation for valid S3 config"""
-        delivery_config_service.create_tenant_config(sample_s3_config)
+        service, stubber = stubbed_delivery_config_service
+        stub_get_item(stubber, service.table_name, sample_s3_config)
         
-        result = delivery_config_service.validate_tenant_config("test-tenant", "s3")
+        result = service.validate_tenant_config("test-tenant", "s3")
         
         assert result["tenant_id"] == "test-tenant"
         assert result["type"] == "s3"
@@ -216,17 +200,17 @@ class TestTenantDeliveryConfigService:
         check_fields = [check["field"] for check in result["checks"]]
         assert "bucket_name" in check_fields
     
-    def test_validate_tenant_config_invalid_role_arn(self, delivery_config_service):
+    def test_validate_tenant_config_invalid_role_arn(self, stubbed_delivery_config_service):
         """Test delivery configuration validation with invalid role ARN"""
-        invalid_config = {
+        service, stubber = stubbed_delivery_config_service
+        stub_get_item(stubber, service.table_name, {
             "tenant_id": "invalid-tenant",
             "type": "cloudwatch",
             "log_distribution_role_arn": "invalid-arn",
             "log_group_name": "/aws/logs/invalid-tenant"
-        }
-        delivery_config_service.create_tenant_config(invalid_config)
+        })
         
-        result = delivery_config_service.validate_tenant_config("invalid-tenant", "cloudwatch")
+        result = service.validate_tenant_config("invalid-tenant", "cloudwatch")
         
         assert result["tenant_id"] == "invalid-tenant"
         assert result["type"] == "cloudwatch"
@@ -241,10 +225,13 @@ class TestTenantDeliveryConfigService:
         assert role_check is not None
         assert "invalid" in role_check["message"]
     
-    def test_validate_tenant_config_not_found(self, delivery_config_service):
+    def test_validate_tenant_config_not_found(self, stubbed_delivery_config_service):
         """Test delivery configuration validation when config doesn't exist"""
+        service, stubber = stubbed_delivery_config_service
+        stub_get_item(stubber, service.table_name)
+        
         with pytest.raises(TenantNotFoundError, match="Tenant 'nonexistent' delivery configuration 'cloudwatch' not found"):
-            delivery_config_service.validate_tenant_config("nonexistent", "cloudwatch")
+            service.validate_tenant_config("nonexistent", "cloudwatch")
 
 
 class TestTenantDeliveryConfigServiceEdgeCases:
@@ -262,15 +249,18 @@ class TestTenantDeliveryConfigServiceEdgeCases:
         assert service.table_name == "test-table"
         assert service.region == "us-east-1"
     
-    def test_lazy_initialization(self, delivery_config_service):
+    def test_lazy_initialization(self, dynamodb_table):
         """Test that DynamoDB resources are initialized lazily"""
+        # A fresh instance: the shared delivery_config_service fixture is pre-bound to the table
+        service = TenantDeliveryConfigService(dynamodb_table.name)
+
         # Before accessing properties, should be None
-        assert delivery_config_service._dynamodb is None
-        assert delivery_config_service._table is None
+        assert service._dynamodb is None
+        assert service._table is None
         
         # After accessing, should be initialized
-        _ = delivery_config_service.dynamodb
-        assert delivery_config_service._dynamodb is not None
+        _ = service.dynamodb
+        assert service._dynamodb is not None
         
-        _ = delivery_config_service.table
-        assert delivery_config_service._table is not None
\ No newline at end of file
+        _ = service.table
+        assert service._table is not None
\ No newline at end of file